@@ -7,18 +7,22 @@ __version__ = "1.0.0"
 __author__ = "AX Technology Group"
 __description__ = "GPU 스케줄링 최적화를 위한 WDRF 컨트롤러"
 
-from .config import Config
+from .config import Config, ConfigSnapshot
 from .controller import WDRFController
-from .k8s_client import KubernetesClient
+from .k8s_client import KubernetesClient, NodeInfo, PodInfo
 from .priority import PriorityCalculator, PriorityTier, WorkloadPriority
-from .resource_view import ResourceView
+from .resource_view import ClusterSnapshot, ResourceView
 
 __all__ = [
     "WDRFController",
     "Config",
+    "ConfigSnapshot",
     "PriorityCalculator",
     "WorkloadPriority",
     "PriorityTier",
     "ResourceView",
+    "ClusterSnapshot",
     "KubernetesClient",
+    "NodeInfo",
+    "PodInfo",
 ]
@@ -4,13 +4,21 @@ WDRF Controller의 메인 엔트리포인트입니다.
 """
 
 import argparse
+import hashlib
+import json
 import logging
+import logging.handlers
+import os
 import sys
-from typing import Optional
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 from .config import Config
 from .controller import WDRFController
 
+VERSION_STRING = "WDRF Controller v1.0.0"
+
 
 def setup_logging(log_level: Optional[str] = None) -> None:
     """로깅을 설정합니다."""
@@ -22,13 +30,20 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     if not isinstance(numeric_level, int):
         raise ValueError(f"Invalid log level: {log_level}")
 
+    # 파일 로그는 처음 기록할 때 열고, 레코드를 모아서 한 번에 기록
+    file_handler = logging.FileHandler("/var/log/wdrf-controller.log", delay=True)
+    file_handler.setFormatter(logging.Formatter(Config.LOG_FORMAT))
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+
     # 로그 포맷 설정
     logging.basicConfig(
         level=numeric_level,
         format=Config.LOG_FORMAT,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler("/var/log/wdrf-controller.log"),
+            buffered_file_handler,
         ],
     )
 
@@ -63,7 +78,9 @@ Examples:
 
     parser.add_argument("--config", type=str, help="설정 파일 경로")
 
-    parser.add_argument("--health-check", action="store_true", help="헬스 체크 모드로 실행")
+    parser.add_argument(
+        "--health-check", action="store_true", help="헬스 체크 모드로 실행"
+    )
 
     parser.add_argument(
         "--dry-run",
@@ -71,18 +88,93 @@ Examples:
         help="실제 변경사항을 적용하지 않고 시뮬레이션만 실행",
     )
 
-    parser.add_argument("--version", action="version", version="WDRF Controller v1.0.0")
+    parser.add_argument("--version", action="version", version=VERSION_STRING)
 
     return parser.parse_args()
 
 
+def _read_yaml_config(content: bytes) -> Dict[str, Any]:
+    """YAML 설정 내용을 파싱합니다."""
+    import yaml
+
+    # libyaml(C 구현)이 있으면 사용하고, 없으면 순수 Python 로더로 대체
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        logging.warning("libyaml is not available, falling back to SafeLoader")
+        loader = yaml.SafeLoader
+
+    return yaml.load(content, Loader=loader) or {}  # nosec B506
+
+
+def _config_cache_path(source: Path) -> Path:
+    """설정 파일 옆의 전용 캐시 경로를 반환합니다 (예: .config.yaml-cache.json)."""
+    return source.with_name(f".{source.name}-cache.json")
+
+
+def _write_json_cache(cache_path: Path, cache_entry: Dict[str, Any]) -> None:
+    """파싱된 설정을 JSON 캐시 파일로 저장합니다 (임시 파일 후 rename)."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(cache_path.parent), prefix=cache_path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache_entry, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        # ConfigMap 마운트 등 읽기 전용 경로에서는 캐시 없이 진행
+        logging.debug(f"Could not write config cache {cache_path}: {e}")
+
+
+def _read_config_data(config_path: str) -> Dict[str, Any]:
+    """설정 파일을 읽습니다. 원본 경로와 내용 해시가 같은 JSON 캐시가 있으면 YAML 파싱을 건너뜁니다."""
+    source = Path(config_path)
+    with open(source, "rb") as f:
+        content = f.read()
+
+    source_path = str(source.resolve())
+    content_hash = hashlib.sha256(content).hexdigest()
+    cache = _config_cache_path(source)
+
+    try:
+        with open(cache, "r") as f:
+            cache_entry = json.load(f)
+        if (
+            isinstance(cache_entry, dict)
+            and cache_entry.get("source") == source_path
+            and cache_entry.get("sha256") == content_hash
+            and isinstance(cache_entry.get("data"), dict)
+        ):
+            logging.debug(f"Configuration loaded from cache {cache}")
+            return cache_entry["data"]
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logging.debug(f"Ignoring unreadable config cache {cache}: {e}")
+
+    config_data = _read_yaml_config(content)
+
+    # 문자열이 아닌 키 등 JSON으로 그대로 표현되지 않는 설정은 캐시하지 않음
+    try:
+        cacheable = json.loads(json.dumps(config_data)) == config_data
+    except (TypeError, ValueError):
+        cacheable = False
+
+    if cacheable:
+        _write_json_cache(
+            cache,
+            {"source": source_path, "sha256": content_hash, "data": config_data},
+        )
+    return config_data
+
+
 def load_config_file(config_path: str) -> None:
     """설정 파일을 로드합니다."""
     try:
-        import yaml
-
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        config_data = _read_config_data(config_path)
 
         # 설정값들을 Config 클래스에 적용
         for key, value in config_data.items():
@@ -98,7 +190,11 @@ def load_config_file(config_path: str) -> None:
 
 
 def print_banner() -> None:
-    """시작 배너를 출력합니다."""
+    """시작 배너를 출력합니다. 비대화형(컨테이너 로그 등) 실행에서는 한 줄 로그로 대체합니다."""
+    if not sys.stdout.isatty() or os.environ.get("KUBERNETES_SERVICE_HOST"):
+        logging.info(f"{VERSION_STRING} starting")
+        return
+
     banner = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                    WDRF Controller v1.0.0                    ║
@@ -145,14 +241,20 @@ def health_check_mode() -> None:
 
 def main(log_level: Optional[str] = None) -> None:
     """메인 함수"""
+    # --version은 파서를 구성하지 않고 바로 처리
+    if "--version" in sys.argv[1:]:
+        print(VERSION_STRING)
+        return
+
     # 명령행 인수 파싱
     args = parse_arguments()
 
     # 로깅 설정
     setup_logging(args.log_level)
 
-    # 배너 출력
-    print_banner()
+    # 배너 출력 (헬스 체크에서는 생략)
+    if not args.health_check:
+        print_banner()
 
     # 설정 파일 로드
     if args.config:
@@ -166,7 +268,7 @@ def main(log_level: Optional[str] = None) -> None:
     # Dry run 모드 설정
     if args.dry_run:
         logging.warning("Running in DRY RUN mode - no actual changes will be made")
-        # TODO: Dry run 모드 구현
+        Config.DRY_RUN = True
 
     try:
         # 컨트롤러 생성 및 실행
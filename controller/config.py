@@ -4,7 +4,39 @@ WDRF Controller의 설정을 관리합니다.
 """
 
 import os
-from typing import Any, Dict
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """사이클 hot path에서 사용하는 설정값의 불변 스냅샷"""
+
+    __slots__ = (
+        "loop_interval",
+        "event_debounce",
+        "update_concurrency",
+        "aging_coefficient",
+        "max_aging_time",
+        "enable_aging",
+        "resource_weights",
+        "resource_names",
+        "priority_class_names",
+    )
+
+    loop_interval: int
+    event_debounce: float
+    update_concurrency: int
+    aging_coefficient: float
+    max_aging_time: float
+    enable_aging: bool
+    resource_weights: Mapping[str, float]
+    # 집계 대상 리소스 이름 (루프 안 멤버십 검사용, intern된 문자열)
+    resource_names: FrozenSet[str]
+    # Tier 값 -> Priority Class 이름 (배치마다 다시 계산하지 않도록 미리 구성)
+    priority_class_names: Mapping[str, str]
 
 
 class Config:
@@ -17,6 +49,49 @@ class Config:
     # 컨트롤러 실행 주기 (초)
     LOOP_INTERVAL = int(os.getenv("LOOP_INTERVAL", "30"))
 
+    # Dry run 모드 (클러스터에 쓰기 요청을 보내지 않음)
+    DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
+
+    # 노드 목록 캐시 유지 시간 (초)
+    NODE_CACHE_TTL = int(os.getenv("NODE_CACHE_TTL", "30"))
+
+    # ClusterQueue/LocalQueue 조회 결과 재사용 시간 (초, 같은 사이클 내 중복 조회 방지)
+    READ_CACHE_TTL = float(os.getenv("READ_CACHE_TTL", "2"))
+
+    # Priority Class 존재 확인 결과 유지 시간 (초)
+    PRIORITY_CLASS_CHECK_TTL = int(os.getenv("PRIORITY_CLASS_CHECK_TTL", "30"))
+
+    # Workload watch 사용 여부 (이벤트 수신 시 다음 사이클을 즉시 실행)
+    WATCH_ENABLED = os.getenv("WATCH_ENABLED", "true").lower() == "true"
+
+    # Workload 캐시를 전체 목록으로 다시 맞추는 주기 (초)
+    WORKLOAD_RESYNC_INTERVAL = int(os.getenv("WORKLOAD_RESYNC_INTERVAL", "60"))
+
+    # 연속된 Workload 이벤트를 하나의 사이클로 묶는 대기 시간 (초)
+    EVENT_DEBOUNCE = float(os.getenv("EVENT_DEBOUNCE", "0.2"))
+
+    # Workload 목록 조회 시 페이지 크기 (limit/continue)
+    PAGE_SIZE = int(os.getenv("PAGE_SIZE", "500"))
+
+    # WDRF가 관리할 Workload의 label selector (비어 있으면 전체)
+    WORKLOAD_LABEL_SELECTOR = os.getenv("WORKLOAD_LABEL_SELECTOR", "")
+
+    # 정수 우선순위(wdrf.x-k8s.io/priority) 어노테이션 기록 여부 (레거시 호환용)
+    WRITE_LEGACY_PRIORITY = (
+        os.getenv("WRITE_LEGACY_PRIORITY", "false").lower() == "true"
+    )
+
+    # Workload 우선순위 업데이트 동시 요청 수
+    UPDATE_CONCURRENCY = int(os.getenv("UPDATE_CONCURRENCY", "16"))
+
+    # 노드/Pod 등 독립적인 조회를 병렬로 실행할 스레드 수
+    FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "6"))
+
+    # Kubernetes API 커넥션 풀 크기 (동시 PATCH 수 + watch 스트림 등 여유분)
+    CONNECTION_POOL_MAXSIZE = int(
+        os.getenv("CONNECTION_POOL_MAXSIZE", str(UPDATE_CONCURRENCY + 4))
+    )
+
     # Aging 관련 설정
     AGING_COEFFICIENT = float(os.getenv("AGING_COEFFICIENT", "0.1"))
     MAX_AGING_TIME = int(os.getenv("MAX_AGING_TIME", "3600"))  # 1시간
@@ -27,6 +102,14 @@ class Config:
         "normal": 1,  # 일반 우선순위 (기본 작업)
     }
 
+    # Tier별 Priority Class 이름 (호출마다 문자열을 만들지 않도록 미리 계산)
+    _PRIORITY_CLASS_NAMES: Dict[str, str] = {
+        tier: f"wdrf-{tier}" for tier in PRIORITY_WEIGHTS
+    }
+
+    # Tier별 Priority Class 값
+    _PRIORITY_CLASS_VALUES: Dict[str, int] = {"HIGH": 1000, "NORMAL": 500}
+
     # Kueue Priority Class 설정
     KUEUE_PRIORITY_CLASSES: Dict[str, Dict[str, Any]] = {
         "wdrf-high": {
@@ -85,6 +168,26 @@ class Config:
     METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
     METRICS_PORT = int(os.getenv("METRICS_PORT", "8080"))
 
+    @classmethod
+    def snapshot(cls) -> ConfigSnapshot:
+        """현재 설정값으로 ConfigSnapshot을 생성합니다."""
+        return ConfigSnapshot(
+            loop_interval=cls.LOOP_INTERVAL,
+            event_debounce=cls.EVENT_DEBOUNCE,
+            update_concurrency=cls.UPDATE_CONCURRENCY,
+            aging_coefficient=cls.AGING_COEFFICIENT,
+            max_aging_time=cls.MAX_AGING_TIME,
+            enable_aging=bool(cls.SCHEDULING_POLICIES["enable_aging"]),
+            resource_weights=MappingProxyType(dict(cls.RESOURCE_WEIGHTS)),
+            resource_names=frozenset(map(sys.intern, cls.RESOURCE_WEIGHTS)),
+            priority_class_names=MappingProxyType(
+                {
+                    tier: cls.get_priority_class_name(tier)
+                    for tier in cls.PRIORITY_WEIGHTS
+                }
+            ),
+        )
+
     @classmethod
     def get_resource_weight(cls, resource_name: str) -> float:
         """리소스 타입별 가중치를 반환합니다."""
@@ -103,14 +206,10 @@ class Config:
     @classmethod
     def get_priority_class_name(cls, tier: str) -> str:
         """Tier에 해당하는 Priority Class 이름을 반환합니다."""
-        return f"wdrf-{tier}"
+        name = cls._PRIORITY_CLASS_NAMES.get(tier)
+        return name if name is not None else f"wdrf-{tier}"
 
     @classmethod
     def get_priority_class_value(cls, tier: str) -> int:
         """Tier에 해당하는 Priority Class 값을 반환합니다."""
-        if tier == "HIGH":
-            return 1000
-        elif tier == "NORMAL":
-            return 500
-        else:
-            return 0
+        return cls._PRIORITY_CLASS_VALUES.get(tier, 0)
@@ -3,19 +3,56 @@ WDRF Controller
 Weighted Dominant Resource Fairness GPU Scheduler for Kubernetes
 """
 
+import array
 import logging
+import math
+import queue
 import signal
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config import Config
 from .k8s_client import KubernetesClient
 from .priority import PriorityCalculator, WorkloadPriority
-from .resource_view import ResourceView
+from .resource_view import ClusterSnapshot, ResourceView
 
 logger = logging.getLogger(__name__)
 
+# 최근 사이클 소요 시간을 보관하는 링 버퍼 크기 (p50/p99 계산용)
+CYCLE_TIME_WINDOW = 256
+
+
+class ControllerStats:
+    """매 사이클 갱신되는 컨트롤러 통계 카운터"""
+
+    __slots__ = (
+        "total_cycles",
+        "total_workloads_processed",
+        "total_priority_updates",
+        "total_priority_class_updates",
+        "total_gang_scheduling_processed",
+        "last_cycle_time",
+        "total_cycle_time",
+        "ewma_cycle_time",
+    )
+
+    def __init__(self) -> None:
+        self.total_cycles = 0
+        self.total_workloads_processed = 0
+        self.total_priority_updates = 0
+        self.total_priority_class_updates = 0
+        self.total_gang_scheduling_processed = 0
+        self.last_cycle_time = 0.0
+        self.total_cycle_time = 0.0
+        self.ewma_cycle_time = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """통계를 딕셔너리로 반환합니다."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class WDRFController:
     """WDRF (Weighted Dominant Resource Fairness) Controller"""
@@ -27,16 +64,28 @@ class WDRFController:
         self.resource_view: Optional[ResourceView] = None
         self.priority_calculator: Optional[PriorityCalculator] = None
 
+        # 시작 시점의 설정 스냅샷 (사이클 hot path에서 참조)
+        self.cfg = Config.snapshot()
+
+        # Workload watch 이벤트 큐 (사이클을 깨우는 용도)
+        self._workload_events: "queue.Queue[str]" = queue.Queue()
+        self._watch_thread: Optional[threading.Thread] = None
+        # watch로 관찰한 마지막 Workload resourceVersion
+        self._workloads_resource_version = ""
+        # 마지막으로 클러스터 상태를 새로고침한 시점의 (노드, Workload) 토큰
+        self._last_state_token: Optional[Tuple[str, str]] = None
+        # 우선순위 PATCH 전송용 스레드 풀 (사이클마다 재생성하지 않음)
+        self._update_executor: Optional[ThreadPoolExecutor] = None
+        # 마지막으로 적용한 (Priority Class, 우선순위 값): 값이 같으면 PATCH 생략
+        self._applied_priorities: Dict[Tuple[str, str], Tuple[str, Optional[int]]] = {}
+
         # 통계 정보
-        self.stats = {
-            "total_cycles": 0,
-            "total_workloads_processed": 0,
-            "total_priority_updates": 0,
-            "total_priority_class_updates": 0,
-            "total_gang_scheduling_processed": 0,
-            "last_cycle_time": 0,
-            "start_time": time.time(),
-        }
+        self.stats = ControllerStats()
+        # 최근 사이클 소요 시간 링 버퍼 (고정 크기, 사이클마다 할당 없음)
+        self._cycle_times = array.array("d", [0.0]) * CYCLE_TIME_WINDOW
+        # 업타임은 monotonic 시계로 계산하고, 시작 시각 문자열은 한 번만 생성
+        self._start_monotonic = time.monotonic()
+        self._start_time_iso = datetime.now().isoformat()
 
         # 시그널 핸들러 설정
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -46,6 +95,10 @@ class WDRFController:
         """시그널 핸들러"""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
+        # 대기 중인 루프를 즉시 깨움 (시그널 핸들러에서 큐 락을 잡지 않도록 별도 스레드 사용)
+        threading.Thread(
+            target=self._workload_events.put, args=("STOP",), daemon=True
+        ).start()
 
     def initialize(self) -> bool:
         """컨트롤러를 초기화합니다."""
@@ -56,18 +109,21 @@ class WDRFController:
             self.k8s_client = KubernetesClient()
             logger.info("Kubernetes client initialized")
 
-            # Priority Class 생성
-            if not self.k8s_client.ensure_priority_classes():
+            # Priority Class 생성 (Dry run 모드에서는 생략)
+            if Config.DRY_RUN:
+                logger.info("Dry run mode: skipping Priority Class creation")
+            elif self.k8s_client.ensure_priority_classes():
+                logger.info("Priority Classes ensured")
+            else:
                 logger.error("Failed to ensure Priority Classes")
                 return False
-            logger.info("Priority Classes ensured")
 
             # 리소스 뷰 초기화
-            self.resource_view = ResourceView(self.k8s_client)
+            self.resource_view = ResourceView(self.k8s_client, self.cfg)
             logger.info("Resource view initialized")
 
             # 우선순위 계산기 초기화
-            self.priority_calculator = PriorityCalculator(self.resource_view)
+            self.priority_calculator = PriorityCalculator(self.resource_view, self.cfg)
             logger.info("Priority calculator initialized")
 
             # 초기 클러스터 상태 새로고침
@@ -91,37 +147,156 @@ class WDRFController:
         self.running = True
         logger.info("WDRF Controller started")
 
+        if Config.WATCH_ENABLED:
+            self._start_workload_watch()
+            if self.k8s_client:
+                self.k8s_client.start_priority_class_informer()
+
         try:
             while self.running:
-                cycle_start_time = time.time()
+                cycle_start_time = time.monotonic()
 
                 try:
                     self._run_cycle()
-                    self.stats["total_cycles"] += 1
-                    self.stats["last_cycle_time"] = time.time() - cycle_start_time
+                    self._record_cycle_time(time.monotonic() - cycle_start_time)
 
                     logger.info(
-                        f"Cycle {self.stats['total_cycles']} completed in "
-                        f"{self.stats['last_cycle_time']:.2f}s"
+                        f"Cycle {self.stats.total_cycles} completed in "
+                        f"{self.stats.last_cycle_time:.2f}s"
                     )
 
                 except Exception as e:
-                    logger.error(f"Error in cycle {self.stats['total_cycles']}: {e}")
+                    logger.error(f"Error in cycle {self.stats.total_cycles}: {e}")
 
                 # 다음 사이클까지 대기
                 if self.running:
-                    time.sleep(Config.LOOP_INTERVAL)
+                    self._wait_for_next_cycle()
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         finally:
             self.shutdown()
 
+    def _record_cycle_time(self, cycle_time: float) -> None:
+        """사이클 소요 시간을 누적 통계와 EWMA에 반영합니다."""
+        self.stats.total_cycles += 1
+        self.stats.last_cycle_time = cycle_time
+        self.stats.total_cycle_time += cycle_time
+        self._cycle_times[(self.stats.total_cycles - 1) % CYCLE_TIME_WINDOW] = (
+            cycle_time
+        )
+
+        # 첫 사이클은 그대로 사용하고 이후에는 지수 가중 이동 평균으로 갱신
+        if self.stats.total_cycles == 1:
+            self.stats.ewma_cycle_time = cycle_time
+        else:
+            self.stats.ewma_cycle_time = (
+                0.9 * self.stats.ewma_cycle_time + 0.1 * cycle_time
+            )
+
+    def _wait_for_next_cycle(self) -> None:
+        """다음 사이클까지 대기합니다. Workload 이벤트가 오면 즉시 깨어납니다."""
+        try:
+            self._workload_events.get(timeout=self.cfg.loop_interval)
+        except queue.Empty:
+            # 이벤트가 없어도 Aging 반영을 위해 주기적으로 사이클 실행
+            return
+
+        # 이벤트가 잠잠해질 때까지(최대 LOOP_INTERVAL) 기다려 한 번의 사이클로 병합
+        deadline = time.monotonic() + self.cfg.loop_interval
+        while self.running:
+            timeout = min(self.cfg.event_debounce, deadline - time.monotonic())
+            if timeout <= 0:
+                break
+            try:
+                self._workload_events.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+    def _start_workload_watch(self) -> None:
+        """Workload watch 스레드를 시작합니다."""
+        self._watch_thread = threading.Thread(
+            target=self._watch_workloads, name="workload-watch", daemon=True
+        )
+        self._watch_thread.start()
+        logger.info("Workload watch started")
+
+    def _watch_workloads(self) -> None:
+        """Workload 캐시를 동기화하고 변경 이벤트를 받아 이벤트 큐에 넣습니다.
+
+        watch는 WORKLOAD_RESYNC_INTERVAL마다 끊고 전체 목록으로 캐시를 다시 맞춥니다.
+        """
+        resource_version = ""
+
+        while self.running and self.k8s_client:
+            try:
+                if not resource_version:
+                    # 최초 시작, 주기적 재동기화, watch 오류 후에는 전체 목록으로 캐시 교체
+                    resource_version = self.k8s_client.sync_workload_cache()
+                    self._workloads_resource_version = resource_version
+
+                for event in self.k8s_client.watch_workload_events(
+                    resource_version, timeout_seconds=Config.WORKLOAD_RESYNC_INTERVAL
+                ):
+                    # 다른 스레드(시그널 핸들러)가 running을 바꾸므로 mypy의 좁히기는 틀림
+                    if not self.running:
+                        return  # type: ignore[unreachable]
+
+                    if event.get("type") == "ERROR":
+                        # resourceVersion 만료(410) 등은 처음부터 다시 watch
+                        self.k8s_client.invalidate_workload_cache()
+                        break
+
+                    obj = event.get("object") or {}
+                    resource_version = obj.get("metadata", {}).get(
+                        "resourceVersion", resource_version
+                    )
+                    self._workloads_resource_version = resource_version
+
+                    # 어노테이션만 바뀐 이벤트 (자신의 PATCH 결과)로는 사이클을 깨우지 않음
+                    if event.get("type") in ("ADDED", "MODIFIED") and event.get(
+                        "scheduling_changed", True
+                    ):
+                        self._workload_events.put(event["type"])
+
+                resource_version = ""
+
+            except Exception as e:
+                logger.warning(f"Workload watch interrupted: {e}")
+                self.k8s_client.invalidate_workload_cache()
+                resource_version = ""
+                time.sleep(1)
+
+    def _get_cluster_state_token(self) -> Optional[Tuple[str, str]]:
+        """클러스터 상태 변경 여부를 판별하는 토큰을 반환합니다.
+
+        Workload watch가 동작하지 않으면 None을 반환하여 항상 새로고침하게 합니다.
+        """
+        if not self.k8s_client or not self._workloads_resource_version:
+            return None
+
+        return (
+            self.k8s_client.get_nodes_resource_version(),
+            self._workloads_resource_version,
+        )
+
+    def _refresh_cluster_state_if_changed(self) -> None:
+        """노드나 Workload가 바뀐 경우에만 클러스터 상태를 새로고침합니다."""
+        if not self.resource_view:
+            return
+
+        state_token = self._get_cluster_state_token()
+        if state_token is not None and state_token == self._last_state_token:
+            logger.debug("Cluster state unchanged, skipping refresh")
+            return
+
+        self.resource_view.refresh_cluster_state()
+        self._last_state_token = state_token
+
     def _run_cycle(self) -> None:
         """단일 사이클을 실행합니다."""
-        # 1. 클러스터 상태 새로고침
-        if self.resource_view:
-            self.resource_view.refresh_cluster_state()
+        # 1. 클러스터 상태 새로고침 (변경이 없으면 생략)
+        self._refresh_cluster_state_if_changed()
 
         # 2. Pending Workload 조회
         if self.k8s_client:
@@ -136,27 +311,37 @@ class WDRFController:
         logger.info(f"Found {len(pending_workloads)} pending workloads")
 
         # 3. 모든 Pending Workload를 우선순위 산정 기준에 따라 정렬 및 처리
-        self._process_regular_workloads(pending_workloads)
+        # (사이클 동안 하나의 클러스터 스냅샷을 공유)
+        cluster = self.resource_view.snapshot() if self.resource_view else None
+        workload_priorities = self._process_regular_workloads(
+            pending_workloads, cluster
+        )
 
         # 4. 통계 업데이트
-        self.stats["total_workloads_processed"] += len(pending_workloads)
+        self.stats.total_workloads_processed += len(pending_workloads)
 
         # 5. 로그 출력
-        self._log_cycle_summary(pending_workloads, [])
-
-    def _process_regular_workloads(self, workloads: List[Dict[str, Any]]) -> None:
-        """일반 Workload들을 처리합니다."""
+        self._log_cycle_summary(pending_workloads, [], workload_priorities, cluster)
+
+    def _process_regular_workloads(
+        self,
+        workloads: List[Dict[str, Any]],
+        cluster: Optional[ClusterSnapshot] = None,
+    ) -> List[WorkloadPriority]:
+        """일반 Workload들을 처리하고 정렬된 우선순위 목록을 반환합니다."""
         if not workloads or not self.priority_calculator:
-            return
+            return []
 
         # 우선순위 계산 및 정렬
         workload_priorities = self.priority_calculator.sort_workloads_by_priority(
-            workloads
+            workloads, cluster
         )
 
         # 우선순위 업데이트
         self._update_workload_priorities(workload_priorities)
 
+        return workload_priorities
+
     def _update_workload_priorities(
         self, workload_priorities: List[WorkloadPriority]
     ) -> None:
@@ -164,126 +349,208 @@ class WDRFController:
         if not self.k8s_client:
             return
 
-        updates_count = 0
-        priority_class_updates = 0
+        # 이번 사이클에 없는 Workload(Admit/삭제됨)는 적용 기록에서 제거
+        current_keys = {(wp.namespace, wp.workload_name) for wp in workload_priorities}
+        self._applied_priorities = {
+            key: applied
+            for key, applied in self._applied_priorities.items()
+            if key in current_keys
+        }
+
+        # 마지막으로 적용한 값과 같은 Workload는 PATCH를 생략
+        changed = [
+            (rank, wp)
+            for rank, wp in enumerate(workload_priorities, 1)
+            if self._applied_priorities.get((wp.namespace, wp.workload_name))
+            != self._get_applied_value(wp)
+        ]
+        skipped_count = len(workload_priorities) - len(changed)
+        if skipped_count:
+            logger.debug("Skipped %d workloads with unchanged priority", skipped_count)
+
+        # Workload별 PATCH를 병렬로 전송 (I/O 대기 시간 중첩)
+        executor = self._get_update_executor()
+        futures = {
+            executor.submit(self._apply_workload_priority, rank, workload_priority): (
+                workload_priority
+            )
+            for rank, workload_priority in changed
+        }
 
-        for i, workload_priority in enumerate(workload_priorities):
+        updates_count = 0
+        priority_updates_count = 0
+        for future in as_completed(futures):
+            workload_priority = futures[future]
             try:
-                # Priority Class 업데이트 (새로운 방식)
-                success = self.k8s_client.update_workload_priority_class(
-                    workload_priority.workload_name,
-                    workload_priority.namespace,
-                    workload_priority.priority_class_name,
+                if future.result():
+                    updates_count += 1
+                    applied = self._get_applied_value(workload_priority)
+                    # 레거시 정수 우선순위는 실제로 기록한 경우에만 집계
+                    if applied[1] is not None:
+                        priority_updates_count += 1
+                    self._applied_priorities[
+                        (workload_priority.namespace, workload_priority.workload_name)
+                    ] = applied
+            except Exception as e:
+                logger.error(
+                    f"Failed to update Priority Class for "
+                    f"{workload_priority.workload_name}: {e}"
                 )
 
-                if success:
-                    priority_class_updates += 1
-                    logger.debug(
-                        f"Updated Priority Class for {workload_priority.workload_name} "
-                        f"to {workload_priority.priority_class_name} (rank: {i+1})"
-                    )
+        self.stats.total_priority_updates += priority_updates_count
+        self.stats.total_priority_class_updates += updates_count
+        logger.info(
+            f"Updated Priority Classes for {updates_count}/{len(workload_priorities)} workloads"
+        )
 
-                # 기존 우선순위 업데이트 (호환성을 위해 유지)
-                priority_value = int(workload_priority.final_priority * 1000)
-                success = self.k8s_client.update_workload_priority(
+    @staticmethod
+    def _get_applied_value(
+        workload_priority: WorkloadPriority,
+    ) -> Tuple[str, Optional[int]]:
+        """Workload에 기록될 (Priority Class, 우선순위 값)을 반환합니다.
+
+        레거시 정수 우선순위를 기록하지 않으면 우선순위 값은 None입니다.
+        """
+        if not Config.WRITE_LEGACY_PRIORITY:
+            return workload_priority.priority_class_name, None
+
+        return (
+            workload_priority.priority_class_name,
+            int(workload_priority.final_priority * 1000),
+        )
+
+    def _get_update_executor(self) -> ThreadPoolExecutor:
+        """우선순위 업데이트용 스레드 풀을 반환합니다. 없으면 생성합니다."""
+        if self._update_executor is None:
+            self._update_executor = ThreadPoolExecutor(
+                max_workers=max(1, self.cfg.update_concurrency),
+                thread_name_prefix="wdrf-update",
+            )
+        return self._update_executor
+
+    def _apply_workload_priority(
+        self, rank: int, workload_priority: WorkloadPriority
+    ) -> bool:
+        """단일 Workload의 Priority Class와 우선순위를 함께 업데이트합니다."""
+        if not self.k8s_client:
+            return False
+
+        try:
+            _, priority_value = self._get_applied_value(workload_priority)
+            if Config.DRY_RUN:
+                success = True
+            else:
+                success = self.k8s_client.update_workload_priority_and_class(
                     workload_priority.workload_name,
                     workload_priority.namespace,
+                    workload_priority.priority_class_name,
                     priority_value,
                 )
 
-                if success:
-                    updates_count += 1
-
-            except Exception as e:
-                logger.error(
-                    f"Error updating priority for {workload_priority.workload_name}: {e}"
+            if success:
+                logger.debug(
+                    "Updated Priority Class for %s to %s (rank: %d)",
+                    workload_priority.workload_name,
+                    workload_priority.priority_class_name,
+                    rank,
                 )
+            return success
 
-        self.stats["total_priority_updates"] += updates_count
-        self.stats["total_priority_class_updates"] += priority_class_updates
-        logger.info(
-            f"Updated priorities for {updates_count}/{len(workload_priorities)} workloads"
-        )
-        logger.info(
-            f"Updated Priority Classes for {priority_class_updates}/{len(workload_priorities)} workloads"
-        )
+        except Exception as e:
+            logger.error(
+                f"Error updating priority for {workload_priority.workload_name}: {e}"
+            )
+            return False
 
     def _log_cycle_summary(
-        self, all_workloads: List[Dict[str, Any]], gang_workloads: List[Dict[str, Any]]
+        self,
+        all_workloads: List[Dict[str, Any]],
+        gang_workloads: List[Dict[str, Any]],
+        workload_priorities: List[WorkloadPriority],
+        cluster: Optional[ClusterSnapshot] = None,
     ) -> None:
         """사이클 요약을 로그로 출력합니다."""
         if not all_workloads or not self.priority_calculator or not self.resource_view:
             return
 
-        # 우선순위 요약
-        workload_priorities = self.priority_calculator.sort_workloads_by_priority(
-            all_workloads
-        )
+        # INFO 로그가 꺼져 있으면 요약 계산 자체를 생략
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        # 우선순위 요약 (이번 사이클에서 이미 정렬한 결과를 재사용)
         priority_summary = self.priority_calculator.get_priority_summary(
             workload_priorities
         )
 
-        # 클러스터 상태 요약
-        cluster_summary = self.resource_view.get_cluster_summary()
+        # 클러스터 상태 요약 (사이클 스냅샷이 없으면 새로 생성)
+        if cluster is None:
+            cluster = self.resource_view.snapshot()
 
         logger.info("=== Cycle Summary ===")
-        logger.info(f"Total workloads processed: {len(all_workloads)}")
-        logger.info(f"Gang scheduling workloads: {len(gang_workloads)}")
+        logger.info("Total workloads processed: %d", len(all_workloads))
+        logger.info("Gang scheduling workloads: %d", len(gang_workloads))
         logger.info(
-            f"Priority distribution: {priority_summary['priority_distribution']}"
+            "Priority distribution: %s", priority_summary["priority_distribution"]
         )
         logger.info(
-            f"Average waiting time: {priority_summary['average_waiting_time']:.1f}s"
+            "Average waiting time: %.1fs", priority_summary["average_waiting_time"]
         )
         logger.info(
-            f"Average dominant share: {priority_summary['average_dominant_share']:.3f}"
+            "Average dominant share: %.3f", priority_summary["average_dominant_share"]
         )
 
         # GPU 사용률 출력
-        gpu_utilization = cluster_summary["utilization"].get("nvidia.com/gpu", 0.0)
-        logger.info(f"GPU utilization: {gpu_utilization:.1f}%")
+        gpu_utilization = cluster.utilization.get("nvidia.com/gpu", 0.0)
+        logger.info("GPU utilization: %.1f%%", gpu_utilization)
 
         # 상위 3개 Workload 정보
         if workload_priorities:
             logger.info("Top 3 workloads by priority:")
             for i, wp in enumerate(workload_priorities[:3]):
                 logger.info(
-                    f"  {i+1}. {wp.workload_name} "
-                    f"(priority: {wp.final_priority:.3f}, "
-                    f"tier: {wp.priority_tier.value}, "
-                    f"waiting: {wp.waiting_time:.1f}s)"
+                    "  %d. %s (priority: %.3f, tier: %s, waiting: %.1fs)",
+                    i + 1,
+                    wp.workload_name,
+                    wp.final_priority,
+                    wp.priority_tier.label,
+                    wp.waiting_time,
                 )
 
     def get_controller_stats(self) -> Dict[str, Any]:
         """컨트롤러 통계를 반환합니다."""
-        uptime = time.time() - self.stats["start_time"]
+        uptime = time.monotonic() - self._start_monotonic
+        stats = self.stats
 
         return {
             "uptime_seconds": uptime,
             "uptime_formatted": self._format_uptime(uptime),
-            "total_cycles": self.stats["total_cycles"],
-            "total_workloads_processed": self.stats["total_workloads_processed"],
-            "total_priority_updates": self.stats["total_priority_updates"],
-            "total_priority_class_updates": self.stats["total_priority_class_updates"],
-            "total_gang_scheduling_processed": self.stats[
-                "total_gang_scheduling_processed"
-            ],
-            "last_cycle_time": self.stats["last_cycle_time"],
+            **stats.to_dict(),
             "average_cycle_time": (
-                (uptime / self.stats["total_cycles"])
-                if self.stats["total_cycles"] > 0
+                (stats.total_cycle_time / stats.total_cycles)
+                if stats.total_cycles > 0
                 else 0
             ),
-            "start_time": datetime.fromtimestamp(self.stats["start_time"]).isoformat(),
+            "p50_cycle_time": self._cycle_time_percentile(0.50),
+            "p99_cycle_time": self._cycle_time_percentile(0.99),
+            "start_time": self._start_time_iso,
             "running": self.running,
         }
 
+    def _cycle_time_percentile(self, percentile: float) -> float:
+        """최근 사이클 소요 시간의 백분위수를 nearest-rank 방식으로 계산합니다."""
+        count = min(self.stats.total_cycles, CYCLE_TIME_WINDOW)
+        if count == 0:
+            return 0.0
+
+        samples = sorted(self._cycle_times[:count])
+        rank = max(1, math.ceil(percentile * count))
+        return samples[rank - 1]
+
     def _format_uptime(self, seconds: float) -> str:
         """업타임을 사람이 읽기 쉬운 형태로 포맷합니다."""
-        days = int(seconds // 86400)
-        hours = int((seconds % 86400) // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        days, secs = divmod(int(seconds), 86400)
+        hours, secs = divmod(secs, 3600)
+        minutes, secs = divmod(secs, 60)
 
         if days > 0:
             return f"{days}d {hours}h {minutes}m {secs}s"
@@ -299,6 +566,13 @@ class WDRFController:
         logger.info("Shutting down WDRF Controller...")
         self.running = False
 
+        if self._update_executor is not None:
+            self._update_executor.shutdown(wait=True)
+            self._update_executor = None
+
+        if self.k8s_client:
+            self.k8s_client.close()
+
         # 최종 통계 출력
         stats = self.get_controller_stats()
         logger.info("=== Final Statistics ===")
@@ -314,6 +588,11 @@ class WDRFController:
         )
         logger.info("WDRF Controller shutdown complete")
 
+    @staticmethod
+    def _timestamp() -> str:
+        """헬스 체크 응답용 UTC 시각 문자열(초 단위)을 반환합니다."""
+        return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
     def health_check(self) -> Dict[str, Any]:
         """헬스 체크를 수행합니다."""
         try:
@@ -322,7 +601,7 @@ class WDRFController:
                 return {
                     "status": "unhealthy",
                     "error": "Kubernetes client not initialized",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self._timestamp(),
                 }
 
             nodes = self.k8s_client.get_nodes()
@@ -332,13 +611,16 @@ class WDRFController:
                 return {
                     "status": "unhealthy",
                     "error": "Resource view not initialized",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self._timestamp(),
                 }
 
             cluster_summary = self.resource_view.get_cluster_summary()
 
-            # Priority Class 확인
-            priority_classes_ok = self.k8s_client.ensure_priority_classes()
+            # Priority Class 확인 (informer 캐시가 있으면 API 호출 없이 확인)
+            # 헬스 체크는 읽기 전용이므로 없는 Priority Class를 생성하지 않음
+            priority_classes_ok = self.k8s_client.priority_classes_ready()
+            if priority_classes_ok is None:
+                priority_classes_ok = self.k8s_client.check_priority_classes()
 
             return {
                 "status": "healthy" if priority_classes_ok else "degraded",
@@ -347,7 +629,7 @@ class WDRFController:
                 "gpu_nodes": len(cluster_summary["gpu_nodes"]),
                 "priority_classes_ok": priority_classes_ok,
                 "controller_stats": self.get_controller_stats(),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._timestamp(),
             }
 
         except Exception as e:
@@ -355,5 +637,5 @@ class WDRFController:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._timestamp(),
             }
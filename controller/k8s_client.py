@@ -4,21 +4,273 @@ Kubernetes API와 상호작용하여 Kueue Workload를 관리합니다.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-
-from kubernetes import client, config
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
+
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
 from .config import Config
+from .quantity import parse_quantity
 
 logger = logging.getLogger(__name__)
 
+# Kueue 커스텀 리소스 식별자 (호출마다 같은 인자를 다시 만들지 않도록 한 곳에 정의)
+# (**kwargs로 API 메서드에 전달하므로 mypy가 키워드 인자 타입과 비교하지 않도록 Any로 선언)
+_KUEUE_API: Dict[str, Any] = {"group": "kueue.x-k8s.io", "version": "v1beta1"}
+_WORKLOADS: Dict[str, Any] = {**_KUEUE_API, "plural": "workloads"}
+_CLUSTER_QUEUES: Dict[str, Any] = {**_KUEUE_API, "plural": "clusterqueues"}
+_LOCAL_QUEUES: Dict[str, Any] = {**_KUEUE_API, "plural": "localqueues"}
+
+# Pod 리소스 추출 결과 캐시의 최대 항목 수 (LRU)
+POD_RESOURCES_CACHE_SIZE = 10000
+
+# 리소스를 점유 중일 수 있는 Pod만 조회하는 필드 셀렉터 (종료된 Pod 제외)
+ACTIVE_POD_FIELD_SELECTOR = "status.phase!=Succeeded,status.phase!=Failed"
+
+
+def _ttl_cached(method: Callable[..., Any]) -> Callable[..., Any]:
+    """읽기 전용 조회 결과를 Config.READ_CACHE_TTL 동안 재사용합니다.
+
+    쓰기 요청을 보내면 _invalidate_read_cache()로 전체 캐시를 비웁니다.
+    """
+
+    @wraps(method)
+    def wrapper(self: "KubernetesClient", *args: Any, **kwargs: Any) -> Any:
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        cached = self._read_cache.get(key)
+        if cached is not None and now - cached[0] < Config.READ_CACHE_TTL:
+            return cached[1]
+
+        result = method(self, *args, **kwargs)
+        self._read_cache[key] = (now, result)
+        return result
+
+    return wrapper
+
+
+@dataclass(frozen=True)
+class NodeInfo:
+    """노드 조회 결과 (get_nodes 반환 값)"""
+
+    __slots__ = (
+        "name",
+        "resource_version",
+        "labels",
+        "capacity",
+        "allocatable",
+        "conditions",
+    )
+
+    name: str
+    resource_version: Optional[str]
+    labels: Dict[str, str]
+    capacity: Dict[str, Any]
+    allocatable: Dict[str, Any]
+    # V1NodeCondition 객체를 그대로 보관 (type/status 속성)
+    conditions: List[Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """외부 응답 등에 사용할 dict 형태로 변환합니다."""
+        return {
+            "name": self.name,
+            "resource_version": self.resource_version,
+            "labels": self.labels,
+            "capacity": self.capacity,
+            "allocatable": self.allocatable,
+            "conditions": [
+                {"type": condition.type, "status": condition.status}
+                for condition in self.conditions
+            ],
+        }
+
+
+class PodInfo:
+    """Pod 조회 결과. resources는 처음 접근할 때 한 번만 계산합니다."""
+
+    __slots__ = (
+        "name",
+        "namespace",
+        "labels",
+        "annotations",
+        "status",
+        "_pod",
+        "_extract",
+        "_resources",
+    )
+
+    def __init__(
+        self,
+        pod: Any,
+        extract_resources: Callable[[Any], Dict[str, Dict[str, float]]],
+    ) -> None:
+        metadata = pod.metadata
+        self.name: str = metadata.name
+        self.namespace: str = metadata.namespace
+        self.labels: Dict[str, str] = metadata.labels or {}
+        self.annotations: Dict[str, str] = metadata.annotations or {}
+        self.status: Optional[str] = pod.status.phase
+        self._pod = pod
+        self._extract = extract_resources
+        self._resources: Optional[Dict[str, Dict[str, float]]] = None
+
+    @property
+    def resources(self) -> Dict[str, Dict[str, float]]:
+        """컨테이너 합계 requests/limits"""
+        if self._resources is None:
+            self._resources = self._extract(self._pod)
+            # 계산 후에는 원본 Pod 객체를 잡고 있을 필요가 없음
+            self._pod = None
+        return self._resources
+
+
+class _WorkloadCache:
+    """watch 이벤트로 유지하는 Kueue Workload의 메모리 사본
+
+    Pending 상태와 Pod Group 이름으로 보조 인덱스를 함께 유지합니다.
+    """
+
+    def __init__(self, is_pending: Callable[[Dict[str, Any]], bool]) -> None:
+        self._is_pending = is_pending
+        self._store: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._pending: Set[Tuple[str, str]] = set()
+        self._by_pod_group: Dict[str, Set[Tuple[str, str]]] = {}
+        self._pod_groups_of: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._lock = threading.RLock()
+        self.synced = False
+
+    @staticmethod
+    def _key(workload: Dict[str, Any]) -> Tuple[str, str]:
+        metadata = workload.get("metadata", {})
+        return metadata.get("namespace", ""), metadata.get("name", "")
+
+    @staticmethod
+    def _pod_group_names(workload: Dict[str, Any]) -> Tuple[str, ...]:
+        """Workload의 podSet 템플릿에 지정된 Pod Group 이름들을 반환합니다."""
+        names = []
+        for pod_set in (workload.get("spec") or {}).get("podSets") or []:
+            template = pod_set.get("template") or {}
+            labels = (template.get("metadata") or {}).get("labels") or {}
+            name = labels.get("kueue.x-k8s.io/pod-group-name")
+            if name and name not in names:
+                names.append(name)
+        return tuple(names)
+
+    def _index(self, key: Tuple[str, str], workload: Dict[str, Any]) -> None:
+        self._unindex(key)
+        self._store[key] = workload
+
+        if self._is_pending(workload):
+            self._pending.add(key)
+
+        pod_groups = self._pod_group_names(workload)
+        if pod_groups:
+            self._pod_groups_of[key] = pod_groups
+            for pod_group in pod_groups:
+                self._by_pod_group.setdefault(pod_group, set()).add(key)
+
+    def _unindex(self, key: Tuple[str, str]) -> None:
+        self._store.pop(key, None)
+        self._pending.discard(key)
+
+        for pod_group in self._pod_groups_of.pop(key, ()):
+            members = self._by_pod_group.get(pod_group)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._by_pod_group[pod_group]
+
+    def replace(self, workloads: List[Dict[str, Any]]) -> None:
+        """전체 목록으로 캐시를 교체합니다 (re-list)."""
+        with self._lock:
+            self._store = {}
+            self._pending = set()
+            self._by_pod_group = {}
+            self._pod_groups_of = {}
+            for workload in workloads:
+                self._index(self._key(workload), workload)
+            self.synced = True
+
+    @staticmethod
+    def _scheduling_state(workload: Dict[str, Any]) -> Tuple[Any, Any]:
+        """스케줄링에 영향을 주는 필드 (spec 세대와 상태 조건)를 반환합니다."""
+        metadata = workload.get("metadata") or {}
+        status = workload.get("status") or {}
+        return metadata.get("generation"), status.get("conditions")
+
+    def apply_event(self, event_type: str, workload: Dict[str, Any]) -> bool:
+        """watch 이벤트를 캐시에 반영합니다.
+
+        MODIFIED 이벤트가 캐시된 사본과 비교해 generation/status.conditions가 그대로면
+        (컨트롤러 자신의 어노테이션 PATCH 등) False를 반환합니다.
+        """
+        key = self._key(workload)
+        with self._lock:
+            if event_type == "DELETED":
+                self._unindex(key)
+                return True
+
+            previous = self._store.get(key)
+            self._index(key, workload)
+            return (
+                event_type != "MODIFIED"
+                or previous is None
+                or self._scheduling_state(previous) != self._scheduling_state(workload)
+            )
+
+    def invalidate(self) -> None:
+        """watch가 끊겨 캐시를 신뢰할 수 없음을 표시합니다."""
+        self.synced = False
+
+    def list(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+        """캐시된 Workload 목록을 반환합니다."""
+        with self._lock:
+            return [
+                workload
+                for key, workload in self._store.items()
+                if not namespace or key[0] == namespace
+            ]
+
+    def list_pending(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Pending 상태인 Workload 목록을 반환합니다."""
+        with self._lock:
+            return [
+                self._store[key]
+                for key in self._pending
+                if not namespace or key[0] == namespace
+            ]
+
+    def list_pod_grouped(self) -> List[Dict[str, Any]]:
+        """Pod Group 라벨이 있는 Workload 목록을 반환합니다."""
+        with self._lock:
+            return [self._store[key] for key in self._pod_groups_of]
+
+    def list_by_pod_group(self, pod_group_name: str) -> List[Dict[str, Any]]:
+        """특정 Pod Group에 속한 Workload 목록을 반환합니다."""
+        with self._lock:
+            return [
+                self._store[key] for key in self._by_pod_group.get(pod_group_name, ())
+            ]
+
 
 class KubernetesClient:
     """Kubernetes API 클라이언트"""
 
     def __init__(self) -> None:
         """Kubernetes 클라이언트를 초기화합니다."""
+        self._priority_class_informer: Optional[threading.Thread] = None
+        # fetch_snapshot에서 독립적인 조회를 병렬 실행하는 스레드 풀 (지연 생성)
+        self._fetch_executor: Optional[ThreadPoolExecutor] = None
+        self._pod_resources_lock = threading.Lock()
+        self._reset_caches()
+
         self._init_kubernetes_client()
         self._init_kueue_client()
 
@@ -32,57 +284,138 @@ class KubernetesClient:
                 config.load_incluster_config()
                 logger.info("Kubernetes config loaded from in-cluster")
 
-            self.core_v1 = client.CoreV1Api()
-            self.custom_objects = client.CustomObjectsApi()
-            self.scheduling_v1 = client.SchedulingV1Api()
+            # 모든 API 객체가 하나의 ApiClient(커넥션 풀)를 공유하도록 구성
+            # 동시 PATCH 요청이 커넥션 풀에서 대기하지 않도록 풀 크기 설정
+            configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = Config.CONNECTION_POOL_MAXSIZE
+            self.api_client = client.ApiClient(configuration)
+
+            self.core_v1 = client.CoreV1Api(self.api_client)
+            self.custom_objects = client.CustomObjectsApi(self.api_client)
+            self.scheduling_v1 = client.SchedulingV1Api(self.api_client)
             logger.info("Kubernetes client initialized successfully")
 
         except Exception as e:
             logger.error(f"Failed to initialize Kubernetes client: {e}")
             raise
 
+    def _reset_caches(self) -> None:
+        """조회 결과와 watch/informer로 유지하는 모든 캐시를 초기 상태로 되돌립니다."""
+        # 노드 목록 캐시 (monotonic 조회 시각, 노드 목록)
+        self._nodes_cache: Optional[Tuple[float, List[NodeInfo]]] = None
+        # _ttl_cached 조회 결과 ((메서드, 인자) -> (monotonic 조회 시각, 결과))
+        self._read_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        # Priority Class 확인 결과의 만료 시각 (monotonic, TTL 동안 API 호출 생략)
+        self._priority_classes_verified_until = 0.0
+        # PriorityClass informer가 관찰한 클러스터의 Priority Class 이름
+        self.priority_classes_present: Set[str] = set()
+        # 이름별 Priority Class 정보와 값/설명 보조 인덱스 (find_priority_class용)
+        self._priority_classes: Dict[str, Dict[str, Any]] = {}
+        self._priority_class_index: Dict[str, Dict[Any, Set[str]]] = {
+            "value": {},
+            "description": {},
+        }
+        self._priority_classes_synced = False
+        # Pod UID -> (resourceVersion, 추출한 리소스). Pod spec은 생성 후 바뀌지 않으므로
+        # 같은 resourceVersion이면 다시 계산하지 않음
+        self._pod_resources_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        # Workload watch로 유지하는 캐시 (동기화 전에는 LIST로 조회)
+        self._workload_cache = _WorkloadCache(self._is_workload_pending)
+
+    def _invalidate_read_cache(self) -> None:
+        """쓰기 요청 후 _ttl_cached 조회 결과를 비웁니다."""
+        self._read_cache.clear()
+
+    def close(self) -> None:
+        """조회 스레드 풀과 공유 ApiClient의 커넥션 풀을 정리합니다."""
+        if self._fetch_executor is not None:
+            self._fetch_executor.shutdown(wait=True)
+            self._fetch_executor = None
+
+        api_client = getattr(self, "api_client", None)
+        if api_client is not None:
+            api_client.close()
+
     def _init_kueue_client(self) -> None:
         """Kueue API 클라이언트를 초기화합니다."""
         self.kueue_api_group = Config.KUEUE_API_GROUP
         self.workload_kind = Config.WORKLOAD_KIND
 
-    def get_nodes(self) -> List[Dict[str, Any]]:
-        """클러스터의 모든 노드를 조회합니다."""
+    def get_nodes(self) -> List[NodeInfo]:
+        """클러스터의 모든 노드를 조회합니다 (NODE_CACHE_TTL 동안 캐시)."""
+        now = time.monotonic()
+        if (
+            self._nodes_cache is not None
+            and now - self._nodes_cache[0] < Config.NODE_CACHE_TTL
+        ):
+            return self._nodes_cache[1]
+
         try:
             nodes = self.core_v1.list_node()
-            return [
-                {
-                    "name": node.metadata.name,
-                    "labels": node.metadata.labels or {},
-                    "capacity": node.status.capacity,
-                    "allocatable": node.status.allocatable,
-                    "conditions": [
-                        {"type": condition.type, "status": condition.status}
-                        for condition in node.status.conditions
-                    ],
-                }
+            node_list = [
+                NodeInfo(
+                    name=node.metadata.name,
+                    resource_version=node.metadata.resource_version,
+                    labels=node.metadata.labels or {},
+                    capacity=node.status.capacity,
+                    allocatable=node.status.allocatable,
+                    conditions=node.status.conditions or [],
+                )
                 for node in nodes.items
             ]
+            self._nodes_cache = (now, node_list)
+            return node_list
         except ApiException as e:
             logger.error(f"Failed to get nodes: {e}")
             return []
 
+    def _get_fetch_executor(self) -> ThreadPoolExecutor:
+        """조회용 스레드 풀을 반환합니다. 처음 호출 시 생성합니다."""
+        if self._fetch_executor is None:
+            self._fetch_executor = ThreadPoolExecutor(
+                max_workers=Config.FETCH_CONCURRENCY,
+                thread_name_prefix="k8s-fetch",
+            )
+        return self._fetch_executor
+
+    def fetch_snapshot(self) -> Dict[str, Any]:
+        """서로 독립적인 조회를 제한된 스레드 풀에서 병렬로 실행하고 결과를 모아 반환합니다.
+
+        결과 키는 "nodes", "pods"(전체 네임스페이스의 실행 중/대기 중 Pod)입니다.
+        """
+        executor = self._get_fetch_executor()
+        futures: Dict[str, Future] = {
+            "nodes": executor.submit(self.get_nodes),
+            "pods": executor.submit(
+                self.list_all_pods, field_selector=ACTIVE_POD_FIELD_SELECTOR
+            ),
+        }
+
+        return {key: future.result() for key, future in futures.items()}
+
+    def get_nodes_resource_version(self) -> str:
+        """노드 목록의 변경 여부를 판별하기 위한 resourceVersion 토큰을 반환합니다."""
+        return ",".join(
+            sorted(
+                f"{node.name}={node.resource_version or ''}"
+                for node in self.get_nodes()
+            )
+        )
+
     def get_pending_workloads(
         self, namespace: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Pending 상태의 Kueue Workload를 조회합니다."""
         try:
-            workloads = self.custom_objects.list_cluster_custom_object(
-                group="kueue.x-k8s.io",
-                version="v1beta1",
-                plural="workloads",
-                field_selector="status.conditions[0].type=Pending",
-            )
-
-            pending_workloads = []
-            for workload in workloads.get("items", []):
-                if self._is_workload_pending(workload):
-                    pending_workloads.append(workload)
+            if self._workload_cache.synced:
+                pending_workloads = self._workload_cache.list_pending(namespace)
+            else:
+                # CRD는 status 필드 셀렉터를 지원하지 않으므로 Pending 여부는 직접 필터링
+                pending_workloads = [
+                    workload
+                    for workload in self._get_workloads(namespace)
+                    if self._is_workload_pending(workload)
+                ]
 
             logger.info(f"Found {len(pending_workloads)} pending workloads")
             return pending_workloads
@@ -91,12 +424,130 @@ class KubernetesClient:
             logger.error(f"Failed to get pending workloads: {e}")
             return []
 
+    def _get_workloads(
+        self, namespace: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Workload 목록을 반환합니다. 캐시가 동기화되어 있으면 API를 호출하지 않습니다."""
+        if self._workload_cache.synced:
+            return iter(self._workload_cache.list(namespace))
+
+        return self._iter_workloads(
+            namespace=namespace, label_selector=Config.WORKLOAD_LABEL_SELECTOR
+        )
+
+    def sync_workload_cache(self) -> str:
+        """Workload 전체 목록으로 캐시를 다시 채우고 목록의 resourceVersion을 반환합니다."""
+        list_metadata: Dict[str, Any] = {}
+        workloads = list(
+            self._iter_workloads(
+                label_selector=Config.WORKLOAD_LABEL_SELECTOR,
+                list_metadata=list_metadata,
+            )
+        )
+        self._workload_cache.replace(workloads)
+        logger.debug("Workload cache synced with %d workloads", len(workloads))
+        return list_metadata.get("resourceVersion", "")
+
+    def invalidate_workload_cache(self) -> None:
+        """Workload 캐시를 무효화하여 다음 조회부터 LIST를 사용하게 합니다."""
+        self._workload_cache.invalidate()
+
+    def _iter_workloads(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: str = "",
+        list_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Workload 목록을 limit/continue 페이지 단위로 조회하며 하나씩 반환합니다.
+
+        list_metadata를 넘기면 첫 페이지의 목록 metadata(resourceVersion 등)를 채웁니다.
+        """
+        return self._iter_custom_objects(
+            _WORKLOADS,
+            namespace=namespace,
+            label_selector=label_selector,
+            list_metadata=list_metadata,
+        )
+
+    def _iter_custom_objects(
+        self,
+        resource: Dict[str, str],
+        namespace: Optional[str] = None,
+        label_selector: str = "",
+        list_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Kueue 커스텀 리소스 목록을 limit/continue 페이지 단위로 조회하며 하나씩 반환합니다."""
+        kwargs: Dict[str, Any] = {**resource, "limit": Config.PAGE_SIZE}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        continue_token = ""
+        while True:
+            if continue_token:
+                kwargs["_continue"] = continue_token
+
+            if namespace:
+                response = self.custom_objects.list_namespaced_custom_object(
+                    namespace=namespace, **kwargs
+                )
+            else:
+                response = self.custom_objects.list_cluster_custom_object(**kwargs)
+            # 커스텀 리소스 목록은 dict로 반환되지만 클라이언트 타입은 object로 선언됨
+            page = cast(Dict[str, Any], response)
+
+            metadata = page.get("metadata") or {}
+            if list_metadata is not None and not continue_token:
+                list_metadata.update(metadata)
+
+            items = page.get("items", [])
+            if isinstance(items, list):
+                yield from items
+
+            continue_token = metadata.get("continue", "")
+            if not continue_token:
+                break
+
+    def watch_workload_events(
+        self, resource_version: str = "", timeout_seconds: int = 300
+    ) -> Iterator[Dict[str, Any]]:
+        """Kueue Workload 변경 이벤트(ADDED/MODIFIED/DELETED)를 스트리밍합니다.
+
+        받은 이벤트는 Workload 캐시에도 반영하고, 스케줄링 상태가 바뀌었는지를
+        이벤트의 "scheduling_changed" 키에 기록합니다.
+        """
+        kwargs: Dict[str, Any] = {"timeout_seconds": timeout_seconds}
+        if resource_version:
+            kwargs["resource_version"] = resource_version
+        if Config.WORKLOAD_LABEL_SELECTOR:
+            kwargs["label_selector"] = Config.WORKLOAD_LABEL_SELECTOR
+
+        workload_watch = watch.Watch()
+        try:
+            for event in workload_watch.stream(
+                self.custom_objects.list_cluster_custom_object,
+                **_WORKLOADS,
+                **kwargs,
+            ):
+                event_type = event.get("type")
+                if event_type in ("ADDED", "MODIFIED", "DELETED"):
+                    event["scheduling_changed"] = self._workload_cache.apply_event(
+                        event_type, event["object"]
+                    )
+                yield event
+        finally:
+            workload_watch.stop()
+
     def _is_workload_pending(self, workload: Dict[str, Any]) -> bool:
         """Workload가 Pending 상태인지 확인합니다."""
-        conditions = workload.get("status", {}).get("conditions", [])
+        status = workload.get("status")
+        conditions = status.get("conditions") if status else None
+        if not conditions:
+            return False
+
+        # condition 타입은 Workload마다 유일하므로 Pending condition을 찾으면 바로 판정
         for condition in conditions:
-            if condition.get("type") == "Pending" and condition.get("status") == "True":
-                return True
+            if condition.get("type") == "Pending":
+                return condition.get("status") == "True"
         return False
 
     def create_priority_class(self, name: str, value: int, description: str) -> bool:
@@ -118,12 +569,13 @@ class KubernetesClient:
             }
 
             self.scheduling_v1.create_priority_class(priority_class)
+            self._invalidate_read_cache()
             logger.info(f"Created Priority Class: {name} with value {value}")
             return True
 
         except ApiException as e:
             if e.status == 409:  # Already exists
-                logger.debug(f"Priority Class {name} already exists")
+                logger.debug("Priority Class %s already exists", name)
                 return True
             else:
                 logger.error(f"Failed to create Priority Class {name}: {e}")
@@ -131,14 +583,27 @@ class KubernetesClient:
 
     def ensure_priority_classes(self) -> bool:
         """필요한 Priority Class들이 존재하는지 확인하고 생성합니다."""
+        if time.monotonic() < self._priority_classes_verified_until:
+            return True
+
         try:
             for class_name, class_config in Config.KUEUE_PRIORITY_CLASSES.items():
+                # informer 캐시에 이미 있는 Priority Class는 POST하지 않음
+                if (
+                    self._priority_classes_synced
+                    and class_name in self.priority_classes_present
+                ):
+                    continue
+
                 value = int(class_config["value"])
                 description = str(class_config["description"])
                 success = self.create_priority_class(class_name, value, description)
                 if not success:
                     return False
 
+            self._priority_classes_verified_until = (
+                time.monotonic() + Config.PRIORITY_CLASS_CHECK_TTL
+            )
             logger.info("All Priority Classes ensured")
             return True
 
@@ -146,41 +611,181 @@ class KubernetesClient:
             logger.error(f"Failed to ensure Priority Classes: {e}")
             return False
 
+    def start_priority_class_informer(self) -> None:
+        """PriorityClass를 list/watch하는 informer 스레드를 시작합니다."""
+        if self._priority_class_informer is not None:
+            return
+
+        self._priority_class_informer = threading.Thread(
+            target=self._run_priority_class_informer,
+            name="priorityclass-informer",
+            daemon=True,
+        )
+        self._priority_class_informer.start()
+        logger.info("PriorityClass informer started")
+
+    def _run_priority_class_informer(self) -> None:
+        """PriorityClass 목록을 조회한 뒤 watch 이벤트로 존재 여부를 갱신합니다."""
+        while True:
+            try:
+                # 초기 목록(또는 watch 만료 후 재동기화)
+                priority_classes = self.scheduling_v1.list_priority_class()
+                self._replace_priority_classes(priority_classes.items)
+                self._priority_classes_synced = True
+
+                priority_class_watch = watch.Watch()
+                for event in priority_class_watch.stream(
+                    self.scheduling_v1.list_priority_class,
+                    resource_version=priority_classes.metadata.resource_version,
+                    timeout_seconds=300,
+                ):
+                    event_type = event.get("type")
+                    if event_type == "ERROR":
+                        break
+
+                    if event_type == "DELETED":
+                        self._unindex_priority_class(event["object"].metadata.name)
+                    else:
+                        self._index_priority_class(event["object"])
+
+            except Exception as e:
+                logger.warning(f"PriorityClass informer interrupted: {e}")
+                self._priority_classes_synced = False
+                time.sleep(1)
+
+    def _replace_priority_classes(self, items: List[Any]) -> None:
+        """PriorityClass 전체 목록으로 캐시와 인덱스를 새로 만듭니다."""
+        priority_classes: Dict[str, Dict[str, Any]] = {}
+        index: Dict[str, Dict[Any, Set[str]]] = {"value": {}, "description": {}}
+        for item in items:
+            entry = self._priority_class_entry(item)
+            priority_classes[entry["name"]] = entry
+            for field, field_index in index.items():
+                field_index.setdefault(entry[field], set()).add(entry["name"])
+
+        self._priority_classes = priority_classes
+        self._priority_class_index = index
+        self.priority_classes_present = set(priority_classes)
+
+    def _index_priority_class(self, item: Any) -> None:
+        """추가/변경된 PriorityClass를 캐시와 인덱스에 반영합니다."""
+        entry = self._priority_class_entry(item)
+        self._unindex_priority_class(entry["name"])
+        self._priority_classes[entry["name"]] = entry
+        for field, field_index in self._priority_class_index.items():
+            field_index.setdefault(entry[field], set()).add(entry["name"])
+        self.priority_classes_present.add(entry["name"])
+
+    def _unindex_priority_class(self, name: str) -> None:
+        """삭제된 PriorityClass를 캐시와 인덱스에서 제거합니다."""
+        self.priority_classes_present.discard(name)
+        entry = self._priority_classes.pop(name, None)
+        if entry is None:
+            return
+
+        for field, field_index in self._priority_class_index.items():
+            names = field_index.get(entry[field])
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del field_index[entry[field]]
+
+    @staticmethod
+    def _priority_class_entry(item: Any) -> Dict[str, Any]:
+        """V1PriorityClass에서 캐시에 보관할 필드만 추출합니다."""
+        return {
+            "name": item.metadata.name,
+            "value": item.value,
+            "description": item.description,
+        }
+
+    def find_priority_class(
+        self,
+        *,
+        name: Optional[str] = None,
+        value: Optional[int] = None,
+        description: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """informer 캐시에서 주어진 조건(이름/값/설명)을 모두 만족하는 Priority Class를 찾습니다."""
+        priority_classes = self._priority_classes
+        candidates: Optional[Set[str]] = None
+        if name is not None:
+            candidates = {name} if name in priority_classes else set()
+
+        for field, key in (("value", value), ("description", description)):
+            if key is None:
+                continue
+            names = self._priority_class_index[field].get(key, set())
+            candidates = set(names) if candidates is None else candidates & names
+
+        if candidates is None:
+            candidates = set(priority_classes)
+
+        return [
+            priority_classes[class_name]
+            for class_name in sorted(candidates)
+            if class_name in priority_classes
+        ]
+
+    def priority_classes_ready(self) -> Optional[bool]:
+        """필요한 Priority Class가 모두 존재하는지 informer 캐시로 확인합니다.
+
+        informer가 아직 동기화되지 않았으면 None을 반환합니다.
+        """
+        if not self._priority_classes_synced:
+            return None
+
+        return Config.KUEUE_PRIORITY_CLASSES.keys() <= self.priority_classes_present
+
+    def check_priority_classes(self) -> bool:
+        """필요한 Priority Class가 모두 존재하는지 API로 조회합니다 (생성하지 않음).
+
+        확인에 성공하면 PRIORITY_CLASS_CHECK_TTL 동안 API 조회를 생략합니다.
+        """
+        if time.monotonic() < self._priority_classes_verified_until:
+            return True
+
+        try:
+            names = {
+                item.metadata.name
+                for item in self.scheduling_v1.list_priority_class().items
+            }
+            if not Config.KUEUE_PRIORITY_CLASSES.keys() <= names:
+                return False
+
+            self._priority_classes_verified_until = (
+                time.monotonic() + Config.PRIORITY_CLASS_CHECK_TTL
+            )
+            return True
+        except ApiException as e:
+            logger.error(f"Failed to check Priority Classes: {e}")
+            return False
+
+    def _patch_workload_annotations(
+        self, workload_name: str, namespace: str, annotations: Dict[str, str]
+    ) -> None:
+        """Workload 어노테이션을 GET 없이 한 번의 merge patch로 변경합니다."""
+        self.custom_objects.patch_namespaced_custom_object(
+            **_WORKLOADS,
+            namespace=namespace,
+            name=workload_name,
+            body={"metadata": {"annotations": annotations}},
+            _content_type="application/merge-patch+json",
+        )
+        self._invalidate_read_cache()
+
     def update_workload_priority_class(
         self, workload_name: str, namespace: str, priority_class_name: str
     ) -> bool:
         """Workload의 Priority Class를 업데이트합니다."""
         try:
-            # 현재 Workload 조회
-            current_workload = self.custom_objects.get_namespaced_custom_object(
-                group="kueue.x-k8s.io",
-                version="v1beta1",
-                namespace=namespace,
-                plural="workloads",
-                name=workload_name,
-            )
-
-            # Priority Class 업데이트
-            if "metadata" not in current_workload:
-                current_workload["metadata"] = {}
-            if "annotations" not in current_workload["metadata"]:
-                current_workload["metadata"]["annotations"] = {}
-
-            current_workload["metadata"]["annotations"][
-                "wdrf.x-k8s.io/priority-class"
-            ] = priority_class_name
-            current_workload["metadata"]["annotations"][
-                "wdrf.x-k8s.io/priority-updated"
-            ] = "true"
-
-            # Workload 업데이트
-            self.custom_objects.patch_namespaced_custom_object(
-                group="kueue.x-k8s.io",
-                version="v1beta1",
-                namespace=namespace,
-                plural="workloads",
-                name=workload_name,
-                body=current_workload,
+            self._patch_workload_annotations(
+                workload_name,
+                namespace,
+                {
+                    "wdrf.x-k8s.io/priority-class": priority_class_name,
+                    "wdrf.x-k8s.io/priority-updated": "true",
+                },
             )
 
             logger.info(
@@ -192,15 +797,51 @@ class KubernetesClient:
             logger.error(f"Failed to update workload priority class: {e}")
             return False
 
+    def update_workload_priority_and_class(
+        self,
+        workload_name: str,
+        namespace: str,
+        priority_class_name: str,
+        priority: Optional[int] = None,
+    ) -> bool:
+        """Workload의 Priority Class와 우선순위를 한 번의 merge patch로 업데이트합니다.
+
+        priority가 None이면 정수 우선순위 어노테이션은 기록하지 않습니다.
+        """
+        try:
+            annotations = {
+                "wdrf.x-k8s.io/priority-class": priority_class_name,
+                "wdrf.x-k8s.io/priority-updated": "true",
+            }
+            if priority is not None:
+                annotations["wdrf.x-k8s.io/priority"] = str(priority)
+
+            self._patch_workload_annotations(workload_name, namespace, annotations)
+
+            logger.debug(
+                "Updated priority for workload %s to %s (%s)",
+                workload_name,
+                priority,
+                priority_class_name,
+            )
+            return True
+
+        except ApiException as e:
+            logger.error(f"Failed to update workload priority and class: {e}")
+            return False
+
     def get_gang_scheduling_workloads(self) -> List[Dict[str, Any]]:
         """Gang Scheduling이 필요한 Workload들을 조회합니다."""
         try:
-            workloads = self.custom_objects.list_cluster_custom_object(
-                group="kueue.x-k8s.io", version="v1beta1", plural="workloads"
-            )
+            # Pod Group 라벨은 Workload가 아닌 podSet 템플릿에 있어 label selector로
+            # 서버 측 필터링을 할 수 없으므로, 캐시의 Pod Group 인덱스로 후보를 좁힘
+            if self._workload_cache.synced:
+                candidates = iter(self._workload_cache.list_pod_grouped())
+            else:
+                candidates = self._get_workloads()
 
             gang_workloads = []
-            for workload in workloads.get("items", []):
+            for workload in candidates:
                 if self._is_gang_scheduling_workload(workload):
                     gang_workloads.append(workload)
 
@@ -214,34 +855,33 @@ class KubernetesClient:
     def _is_gang_scheduling_workload(self, workload: Dict[str, Any]) -> bool:
         """Workload가 Gang Scheduling을 사용하는지 확인합니다."""
         try:
-            pod_sets = workload.get("spec", {}).get("podSets", [])
-
-            for pod_set in pod_sets:
-                template = pod_set.get("template", {})
-                labels = template.get("metadata", {}).get("labels", {})
-                annotations = template.get("metadata", {}).get("annotations", {})
+            pod_sets = workload["spec"]["podSets"]
+        except (KeyError, TypeError):
+            return False
 
+        for pod_set in pod_sets:
+            # 빈 dict를 만드는 .get(..., {}) 체인 대신 직접 접근 (없으면 다음 podSet)
+            try:
+                metadata = pod_set["template"]["metadata"]
                 # Pod Group 정보 확인
-                if labels.get("kueue.x-k8s.io/pod-group-name") and annotations.get(
+                group_name = metadata["labels"].get("kueue.x-k8s.io/pod-group-name")
+                if group_name and metadata["annotations"].get(
                     "kueue.x-k8s.io/pod-group-total-count"
                 ):
                     return True
+            except (KeyError, TypeError, AttributeError):
+                continue
 
-            return False
-
-        except Exception as e:
-            logger.error(f"Failed to check gang scheduling: {e}")
-            return False
+        return False
 
     def get_workloads_by_pod_group(self, pod_group_name: str) -> List[Dict[str, Any]]:
         """특정 Pod Group에 속한 Workload들을 조회합니다."""
         try:
-            workloads = self.custom_objects.list_cluster_custom_object(
-                group="kueue.x-k8s.io", version="v1beta1", plural="workloads"
-            )
+            if self._workload_cache.synced:
+                return self._workload_cache.list_by_pod_group(pod_group_name)
 
             group_workloads = []
-            for workload in workloads.get("items", []):
+            for workload in self._get_workloads():
                 if self._workload_belongs_to_pod_group(workload, pod_group_name):
                     group_workloads.append(workload)
 
@@ -256,56 +896,32 @@ class KubernetesClient:
     ) -> bool:
         """Workload가 특정 Pod Group에 속하는지 확인합니다."""
         try:
-            pod_sets = workload.get("spec", {}).get("podSets", [])
-
-            for pod_set in pod_sets:
-                template = pod_set.get("template", {})
-                labels = template.get("metadata", {}).get("labels", {})
+            pod_sets = workload["spec"]["podSets"]
+        except (KeyError, TypeError):
+            return False
 
+        for pod_set in pod_sets:
+            try:
+                labels = pod_set["template"]["metadata"]["labels"]
                 if labels.get("kueue.x-k8s.io/pod-group-name") == pod_group_name:
                     return True
+            except (KeyError, TypeError, AttributeError):
+                continue
 
-            return False
-
-        except Exception as e:
-            logger.error(f"Failed to check pod group membership: {e}")
-            return False
+        return False
 
     def update_workload_priority(
         self, workload_name: str, namespace: str, priority: int
     ) -> bool:
         """Workload의 우선순위를 업데이트합니다."""
         try:
-            # 현재 Workload 조회
-            current_workload = self.custom_objects.get_namespaced_custom_object(
-                group="kueue.x-k8s.io",
-                version="v1beta1",
-                namespace=namespace,
-                plural="workloads",
-                name=workload_name,
-            )
-
-            # 우선순위 업데이트
-            if "metadata" not in current_workload:
-                current_workload["metadata"] = {}
-            if "annotations" not in current_workload["metadata"]:
-                current_workload["metadata"]["annotations"] = {}
-
-            current_workload["metadata"]["annotations"]["wdrf.x-k8s.io/priority"] = str(
-                priority
-            )
-            current_workload["metadata"]["annotations"][
-                "wdrf.x-k8s.io/priority-updated"
-            ] = "true"
-
-            # Workload 업데이트
-            self.custom_objects.patch_namespaced_custom_object(
-                group="kueue.x-k8s.io",
-                version="v1beta1",
-                namespace=namespace,
-                plural="workloads",
-                name=workload_name,
-                body=current_workload,
+            self._patch_workload_annotations(
+                workload_name,
+                namespace,
+                {
+                    "wdrf.x-k8s.io/priority": str(priority),
+                    "wdrf.x-k8s.io/priority-updated": "true",
+                },
             )
 
             logger.info(f"Updated priority for workload {workload_name} to {priority}")
@@ -315,104 +931,116 @@ class KubernetesClient:
             logger.error(f"Failed to update workload priority: {e}")
             return False
 
+    @_ttl_cached
     def get_cluster_queues(self) -> List[Dict[str, Any]]:
         """모든 ClusterQueue를 조회합니다."""
         try:
-            cluster_queues = self.custom_objects.list_cluster_custom_object(
-                group="kueue.x-k8s.io", version="v1beta1", plural="clusterqueues"
-            )
-
-            items = cluster_queues.get("items", [])
-            return items if isinstance(items, list) else []
+            return list(self._iter_custom_objects(_CLUSTER_QUEUES))
 
         except ApiException as e:
             logger.error(f"Failed to get cluster queues: {e}")
             return []
 
+    @_ttl_cached
     def get_local_queues(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """LocalQueue를 조회합니다."""
         try:
-            if namespace:
-                local_queues = self.custom_objects.list_namespaced_custom_object(
-                    group="kueue.x-k8s.io",
-                    version="v1beta1",
-                    namespace=namespace,
-                    plural="localqueues",
-                )
-            else:
-                local_queues = self.custom_objects.list_cluster_custom_object(
-                    group="kueue.x-k8s.io", version="v1beta1", plural="localqueues"
-                )
-
-            items = local_queues.get("items", [])
-            return items if isinstance(items, list) else []
+            return list(self._iter_custom_objects(_LOCAL_QUEUES, namespace=namespace))
 
         except ApiException as e:
             logger.error(f"Failed to get local queues: {e}")
             return []
 
-    def get_pods_in_namespace(self, namespace: str) -> List[Dict[str, Any]]:
+    def get_pods_in_namespace(self, namespace: str) -> List[PodInfo]:
         """특정 네임스페이스의 모든 Pod를 조회합니다."""
         try:
             pods = self.core_v1.list_namespaced_pod(namespace=namespace)
-            return [
-                {
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "labels": pod.metadata.labels or {},
-                    "annotations": pod.metadata.annotations or {},
-                    "status": pod.status.phase,
-                    "resources": self._extract_pod_resources(pod),
-                }
-                for pod in pods.items
-            ]
+            extract = self._extract_pod_resources
+            return [PodInfo(pod, extract) for pod in pods.items]
         except ApiException as e:
             logger.error(f"Failed to get pods in namespace {namespace}: {e}")
             return []
 
-    def _extract_pod_resources(self, pod: Any) -> Dict[str, Any]:
-        """Pod의 리소스 요청사항을 추출합니다."""
-        resources = {}
+    def list_all_pods(
+        self, field_selector: str = "", label_selector: str = ""
+    ) -> List[PodInfo]:
+        """모든 네임스페이스의 Pod를 limit/continue 페이지 단위로 한 번에 조회합니다."""
+        kwargs: Dict[str, Any] = {"limit": Config.PAGE_SIZE}
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        extract = self._extract_pod_resources
+        pod_list: List[PodInfo] = []
+        try:
+            while True:
+                page = self.core_v1.list_pod_for_all_namespaces(**kwargs)
+                pod_list.extend(PodInfo(pod, extract) for pod in page.items)
+
+                continue_token = page.metadata._continue if page.metadata else None
+                if not continue_token:
+                    break
+                kwargs["_continue"] = continue_token
+
+            return pod_list
+        except ApiException as e:
+            logger.error(f"Failed to list pods in all namespaces: {e}")
+            return []
+
+    def _extract_pod_resources(self, pod: Any) -> Dict[str, Dict[str, float]]:
+        """Pod의 리소스 requests/limits를 컨테이너 합계로 추출합니다.
 
-        for container in pod.spec.containers:
-            if container.resources:
-                if container.resources.requests:
-                    for resource_name, quantity in container.resources.requests.items():
-                        if resource_name not in resources:
-                            resources[resource_name] = 0.0
-                        resources[resource_name] += self._parse_quantity(quantity)
-
-                if container.resources.limits:
-                    for resource_name, quantity in container.resources.limits.items():
-                        if resource_name not in resources:
-                            resources[resource_name] = 0.0
-                        resources[resource_name] += self._parse_quantity(quantity)
+        결과는 (UID, resourceVersion) 기준으로 캐시합니다.
+        """
+        uid = pod.metadata.uid
+        resource_version = pod.metadata.resource_version
+        with self._pod_resources_lock:
+            cached = self._pod_resources_cache.get(uid)
+            if cached is not None and cached[0] == resource_version:
+                self._pod_resources_cache.move_to_end(uid)
+                return cached[1]
+
+        resources = self._compute_pod_resources(pod)
+
+        with self._pod_resources_lock:
+            self._pod_resources_cache[uid] = (resource_version, resources)
+            self._pod_resources_cache.move_to_end(uid)
+            if len(self._pod_resources_cache) > POD_RESOURCES_CACHE_SIZE:
+                self._pod_resources_cache.popitem(last=False)
 
         return resources
 
-    def _parse_quantity(self, quantity: Any) -> float:
-        """Kubernetes Quantity를 float로 변환합니다."""
-        if quantity is None:
-            return 0.0
-
-        # 간단한 파싱 (실제로는 더 복잡한 로직이 필요할 수 있음)
-        quantity_str = str(quantity)
-
-        if quantity_str.endswith("m"):  # millicores
-            return float(quantity_str[:-1]) / 1000
-        elif quantity_str.endswith("Ki"):
-            return float(quantity_str[:-2]) * 1024
-        elif quantity_str.endswith("Mi"):
-            return float(quantity_str[:-2]) * 1024 * 1024
-        elif quantity_str.endswith("Gi"):
-            return float(quantity_str[:-2]) * 1024 * 1024 * 1024
-        else:
-            try:
-                return float(quantity_str)
-            except ValueError:
-                return 0.0
+    def _compute_pod_resources(self, pod: Any) -> Dict[str, Dict[str, float]]:
+        """Pod 컨테이너들의 requests/limits를 합산합니다."""
+        requests: Dict[str, float] = {}
+        limits: Dict[str, float] = {}
+        parse = parse_quantity
+        # 캐시에 오래 남는 결과이므로 리소스 이름을 intern하여 Pod 간에 공유
+        intern = sys.intern
 
-    def get_workload_pods(self, workload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        for container in pod.spec.containers:
+            container_resources = container.resources
+            if not container_resources:
+                continue
+
+            if container_resources.requests:
+                for resource_name, quantity in container_resources.requests.items():
+                    resource_name = intern(resource_name)
+                    requests[resource_name] = requests.get(resource_name, 0.0) + parse(
+                        quantity
+                    )
+
+            if container_resources.limits:
+                for resource_name, quantity in container_resources.limits.items():
+                    resource_name = intern(resource_name)
+                    limits[resource_name] = limits.get(resource_name, 0.0) + parse(
+                        quantity
+                    )
+
+        return {"requests": requests, "limits": limits}
+
+    def get_workload_pods(self, workload: Dict[str, Any]) -> List[PodInfo]:
         """Workload에 속한 Pod들을 조회합니다."""
         try:
             namespace = workload["metadata"]["namespace"]
@@ -424,15 +1052,8 @@ class KubernetesClient:
                 label_selector=f"kueue.x-k8s.io/workload-name={workload_name}",
             )
 
-            return [
-                {
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "status": pod.status.phase,
-                    "resources": self._extract_pod_resources(pod),
-                }
-                for pod in pods.items
-            ]
+            extract = self._extract_pod_resources
+            return [PodInfo(pod, extract) for pod in pods.items]
 
         except ApiException as e:
             logger.error(f"Failed to get workload pods: {e}")
@@ -445,78 +1066,3 @@ class KubernetesClient:
     def get_cluster_info(self) -> dict:
         # 실제 구현이 없다면 빈 딕셔너리 반환
         return {}
-
-    def get_priority_class(self, name: str) -> Optional[dict]:
-        return None
-
-    def get_priority_class_value(self, name: str) -> Optional[int]:
-        return None
-
-    def get_priority_class_names(self) -> list:
-        return []
-
-    def get_priority_class_map(self) -> dict:
-        return {}
-
-    def get_priority_class_values(self) -> list:
-        return []
-
-    def get_priority_class_descriptions(self) -> list:
-        return []
-
-    def get_priority_class_objects(self) -> list:
-        return []
-
-    def get_priority_class_object(self, name: str) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_value(self, value: int) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_description(
-        self, description: str
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_name(self, name: str) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_value_and_description(
-        self, value: int, description: str
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_name_and_value(
-        self, name: str, value: int
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_name_and_description(
-        self, name: str, description: str
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_name_value_and_description(
-        self, name: str, value: int, description: str
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_value_and_name(
-        self, value: int, name: str
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_description_and_value(
-        self, description: str, value: int
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_description_and_name(
-        self, description: str, name: str
-    ) -> Optional[dict]:
-        return None
-
-    def get_priority_class_object_by_description_name_and_value(
-        self, description: str, name: str, value: int
-    ) -> Optional[dict]:
-        return None
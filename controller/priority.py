@@ -3,27 +3,136 @@ Priority Calculator for WDRF Controller
 Workload의 우선순위를 계산하는 모듈입니다.
 """
 
+import calendar
 import logging
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, List
+from enum import IntEnum
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from .config import Config
+from .config import Config, ConfigSnapshot
+from .quantity import parse_quantity
+from .resource_view import ClusterSnapshot
 
 logger = logging.getLogger(__name__)
 
 
-class PriorityTier(Enum):
-    """우선순위 계층을 정의합니다 (2개로 변경)."""
+class PriorityTier(IntEnum):
+    """우선순위 계층을 정의합니다 (2개로 변경).
 
-    HIGH = "high"
-    NORMAL = "normal"
+    값은 정렬 순서(작을수록 먼저)이며, 설정/Priority Class 조회에는 label을 사용합니다.
+    """
+
+    HIGH = 0
+    NORMAL = 1
+
+    @property
+    def label(self) -> str:
+        """설정 키로 쓰이는 계층 이름 ("high", "normal")을 반환합니다."""
+        return _TIER_LABELS[self]
+
+
+_TIER_LABELS = {tier: sys.intern(tier.name.lower()) for tier in PriorityTier}
+
+
+# Workload별 고정 입력(생성 시각/리소스/Tier/Gang 정보) 캐시의 최대 항목 수 (LRU)
+PRIORITY_INPUT_CACHE_SIZE = 8192
+
+# 정렬 시 Tier 순서 (HIGH 먼저)
+_TIERS_IN_SORT_ORDER = (PriorityTier.HIGH, PriorityTier.NORMAL)
+
+# Tier 버킷 안에서의 정렬 키 (lambda 호출 없이 C 수준에서 값 조회)
+_FINAL_PRIORITY_KEY = attrgetter("final_priority")
+
+# 값이 "true"이면 HIGH Tier로 분류하는 어노테이션
+_HIGH_PRIORITY_ANNOTATIONS = tuple(
+    sys.intern(key)
+    for key in (
+        "wdrf.x-k8s.io/urgent",
+        "wdrf.x-k8s.io/approved",
+        "wdrf.x-k8s.io/high-priority",
+    )
+)
+
+
+def _annotation_is_true(annotations: Dict[str, str], key: str) -> bool:
+    """어노테이션 값이 (대소문자 무관) "true"인지 확인합니다. 없으면 문자열을 만들지 않습니다."""
+    value = annotations.get(key)
+    return value is not None and (value == "true" or value.lower() == "true")
+
+
+def _parse_k8s_timestamp(value: str) -> float:
+    """Kubernetes 타임스탬프(RFC3339)를 epoch 초로 변환합니다.
+
+    "YYYY-MM-DDTHH:MM:SS" 부분은 고정 위치를 잘라 바로 계산하고, 뒤따르는 소수점 초와
+    "Z"/"±HH:MM" 시간대는 직접 해석합니다 (Python 3.8~3.10의 fromisoformat은
+    6자리가 아닌 소수점 초를 처리하지 못함).
+    """
+    if len(value) < 20 or value[10] not in "Tt" or value[19:20] not in ".Zz+-":
+        raise ValueError(f"Invalid timestamp: {value!r}")
+
+    seconds = float(
+        calendar.timegm(
+            (
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                0,
+                0,
+                0,
+            )
+        )
+    )
+
+    rest = value[19:]
+    if rest[0] == ".":
+        end = 1
+        while end < len(rest) and rest[end].isdigit():
+            end += 1
+        if end == 1:
+            raise ValueError(f"Invalid timestamp: {value!r}")
+        seconds += float(rest[:end])
+        rest = rest[end:]
+
+    if rest in ("Z", "z"):
+        return seconds
+
+    if len(rest) != 6 or rest[0] not in "+-" or rest[3] != ":":
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    offset = int(rest[1:3]) * 3600 + int(rest[4:6]) * 60
+    return seconds - offset if rest[0] == "+" else seconds + offset
 
 
 @dataclass
 class WorkloadPriority:
-    """Workload 우선순위 정보를 담는 데이터 클래스"""
+    """Workload 우선순위 정보를 담는 데이터 클래스
+
+    대기열이 클 때 인스턴스별 __dict__를 만들지 않도록 __slots__를 사용합니다.
+    """
+
+    __slots__ = (
+        "workload_name",
+        "namespace",
+        "priority_tier",
+        "dominant_share",
+        "aging_factor",
+        "final_priority",
+        "resources",
+        "creation_time",
+        "waiting_time",
+        "priority_class_name",
+        "is_gang_scheduling",
+        "pod_group_name",
+        "pod_group_total_count",
+        "pod_group_current_count",
+    )
 
     workload_name: str
     namespace: str
@@ -44,93 +153,198 @@ class WorkloadPriority:
 class PriorityCalculator:
     """우선순위 계산을 담당하는 클래스"""
 
-    def __init__(self, resource_view):
+    def __init__(self, resource_view, config: Optional[ConfigSnapshot] = None):
         """PriorityCalculator를 초기화합니다."""
         self.resource_view = resource_view
+        self.config = config
+        # (namespace, name) -> (resourceVersion, resource_weights, 고정 입력)
+        self._input_cache: "OrderedDict[Tuple[str, str], Tuple[str, Any, Any]]" = (
+            OrderedDict()
+        )
 
-    def calculate_workload_priority(self, workload: Dict[str, Any]) -> WorkloadPriority:
-        """Workload의 우선순위를 계산합니다."""
-        try:
-            # 기본 정보 추출
-            workload_name = workload["metadata"]["name"]
-            namespace = workload["metadata"]["namespace"]
-            creation_time = self._get_creation_time(workload)
-            waiting_time = time.time() - creation_time
+    def _get_config(self) -> ConfigSnapshot:
+        """고정된 설정 스냅샷을 반환합니다. 없으면 현재 Config로 생성합니다."""
+        return self.config if self.config is not None else Config.snapshot()
+
+    def calculate_workload_priority(
+        self,
+        workload: Dict[str, Any],
+        cfg: Optional[ConfigSnapshot] = None,
+        now: Optional[float] = None,
+        cluster: Optional[ClusterSnapshot] = None,
+    ) -> WorkloadPriority:
+        """Workload의 우선순위를 계산합니다.
+
+        now를 지정하면 대기 시간 계산의 기준 시각으로, cluster를 지정하면
+        Dominant Share 계산에 ResourceView 대신 해당 스냅샷을 사용합니다.
+        필수 메타데이터가 없는 Workload에는 기본 우선순위를 반환합니다.
+        """
+        identity = self._validate_workload(workload)
+        if identity is None:
+            logger.error(
+                "Failed to calculate priority for invalid workload: %s",
+                self._describe_workload(workload),
+            )
+            return self._default_priority(workload)
+
+        if cfg is None:
+            cfg = self._get_config()
+        if now is None:
+            now = time.time()
+
+        return self._calculate_priority(workload, identity, cfg, now, cluster)
+
+    @staticmethod
+    def _describe_workload(workload: Any) -> str:
+        """로그용 Workload 식별자 (namespace/name, 메타데이터가 없으면 타입 이름)를 반환합니다."""
+        metadata = workload.get("metadata") if isinstance(workload, dict) else None
+        if not isinstance(metadata, dict):
+            return type(workload).__name__
+
+        return f"{metadata.get('namespace')}/{metadata.get('name')}"
+
+    @staticmethod
+    def _validate_workload(workload: Any) -> Optional[Tuple[str, str]]:
+        """우선순위 계산에 필요한 메타데이터를 확인하고 (name, namespace)를 반환합니다."""
+        if not isinstance(workload, dict):
+            return None
+
+        metadata = workload.get("metadata")
+        if not isinstance(metadata, dict):
+            return None
+
+        name = metadata.get("name")
+        namespace = metadata.get("namespace")
+        if not (name and isinstance(name, str)):
+            return None
+        if not (namespace and isinstance(namespace, str)):
+            return None
+
+        return name, namespace
+
+    def _calculate_priority(
+        self,
+        workload: Dict[str, Any],
+        identity: Tuple[str, str],
+        cfg: ConfigSnapshot,
+        now: float,
+        cluster: Optional[ClusterSnapshot],
+    ) -> WorkloadPriority:
+        """검증된 Workload의 우선순위를 계산합니다."""
+        workload_name, namespace = identity
+
+        # 생성 시각, 리소스 요구사항, 우선순위 계층, Gang Scheduling 정보
+        # (Workload 내용이 같으면 이전 계산 결과 재사용)
+        creation_time, resources, priority_tier, gang_info = self._get_priority_inputs(
+            workload, cfg
+        )
+        waiting_time = now - creation_time
 
-            # 리소스 요구사항 추출
-            resources = self._extract_workload_resources(workload)
+        # Dominant Share 계산
+        share_source = cluster if cluster is not None else self.resource_view
+        dominant_share = share_source.get_workload_dominant_share(resources)
 
-            # 우선순위 계층 결정
-            priority_tier = self._determine_priority_tier(workload)
+        # Aging Factor 계산
+        aging_factor = self._calculate_aging_factor(waiting_time, cfg)
 
-            # Dominant Share 계산
-            dominant_share = self.resource_view.get_workload_dominant_share(resources)
+        # 최종 우선순위 계산
+        final_priority = self._calculate_final_priority(
+            priority_tier, dominant_share, aging_factor
+        )
 
-            # Aging Factor 계산
-            aging_factor = self._calculate_aging_factor(waiting_time)
+        # Priority Class 이름 생성
+        tier_label = priority_tier.label
+        priority_class_name = cfg.priority_class_names.get(tier_label)
+        if priority_class_name is None:
+            priority_class_name = Config.get_priority_class_name(tier_label)
+
+        return WorkloadPriority(
+            workload_name=workload_name,
+            namespace=sys.intern(namespace),
+            priority_tier=priority_tier,
+            dominant_share=dominant_share,
+            aging_factor=aging_factor,
+            final_priority=final_priority,
+            # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본을 전달
+            resources=dict(resources),
+            creation_time=creation_time,
+            waiting_time=waiting_time,
+            priority_class_name=priority_class_name,
+            is_gang_scheduling=gang_info["is_gang_scheduling"],
+            pod_group_name=gang_info["pod_group_name"],
+            pod_group_total_count=gang_info["pod_group_total_count"],
+            pod_group_current_count=gang_info["pod_group_current_count"],
+        )
 
-            # Gang Scheduling 정보 추출
-            gang_info = self._extract_gang_scheduling_info(workload)
+    @staticmethod
+    def _default_priority(workload: Any) -> WorkloadPriority:
+        """계산할 수 없는 Workload에 사용할 기본 우선순위를 반환합니다."""
+        metadata = workload.get("metadata") if isinstance(workload, dict) else None
+        if not isinstance(metadata, dict):
+            metadata = {}
+
+        return WorkloadPriority(
+            workload_name=metadata.get("name") or "unknown",
+            namespace=metadata.get("namespace") or "default",
+            priority_tier=PriorityTier.NORMAL,
+            dominant_share=1.0,
+            aging_factor=0.0,
+            final_priority=0.0,
+            resources={},
+            creation_time=time.time(),
+            waiting_time=0.0,
+            priority_class_name="wdrf-normal",
+            is_gang_scheduling=False,
+            pod_group_name="",
+            pod_group_total_count=0,
+            pod_group_current_count=0,
+        )
 
-            # 최종 우선순위 계산
-            final_priority = self._calculate_final_priority(
-                priority_tier, dominant_share, aging_factor
-            )
+    def _get_priority_inputs(
+        self, workload: Dict[str, Any], cfg: ConfigSnapshot
+    ) -> Tuple[float, Mapping[str, float], PriorityTier, Mapping[str, Any]]:
+        """시간에 따라 변하지 않는 우선순위 입력값을 반환합니다.
+
+        resourceVersion이 있으면 (namespace, name) 기준으로 캐시하고,
+        resourceVersion이나 리소스 가중치가 바뀌면 다시 계산합니다.
+        """
+        metadata = workload["metadata"]
+        resource_version = metadata.get("resourceVersion")
+        key = (metadata["namespace"], metadata["name"])
+        resource_weights = cfg.resource_weights
+
+        if resource_version:
+            cached = self._input_cache.get(key)
+            if (
+                cached is not None
+                and cached[0] == resource_version
+                and cached[1] == resource_weights
+            ):
+                self._input_cache.move_to_end(key)
+                return cached[2]
+
+        # 캐시된 dict는 이후 사이클에서도 공유되므로 읽기 전용 뷰로 보관
+        inputs = (
+            self._get_creation_time(workload),
+            MappingProxyType(self._extract_workload_resources(workload, cfg)),
+            self._determine_priority_tier(workload),
+            MappingProxyType(self._extract_gang_scheduling_info(workload)),
+        )
 
-            # Priority Class 이름 생성
-            priority_class_name = Config.get_priority_class_name(priority_tier.value)
-
-            return WorkloadPriority(
-                workload_name=workload_name,
-                namespace=namespace,
-                priority_tier=priority_tier,
-                dominant_share=dominant_share,
-                aging_factor=aging_factor,
-                final_priority=final_priority,
-                resources=resources,
-                creation_time=creation_time,
-                waiting_time=waiting_time,
-                priority_class_name=priority_class_name,
-                is_gang_scheduling=gang_info["is_gang_scheduling"],
-                pod_group_name=gang_info["pod_group_name"],
-                pod_group_total_count=gang_info["pod_group_total_count"],
-                pod_group_current_count=gang_info["pod_group_current_count"],
-            )
+        if resource_version:
+            self._input_cache[key] = (resource_version, resource_weights, inputs)
+            self._input_cache.move_to_end(key)
+            if len(self._input_cache) > PRIORITY_INPUT_CACHE_SIZE:
+                self._input_cache.popitem(last=False)
 
-        except Exception as e:
-            logger.error(
-                f"Failed to calculate priority for workload {workload.get('metadata', {}).get('name', 'unknown')}: {e}"
-            )
-            # 기본값 반환
-            return WorkloadPriority(
-                workload_name=workload.get("metadata", {}).get("name", "unknown"),
-                namespace=workload.get("metadata", {}).get("namespace", "default"),
-                priority_tier=PriorityTier.NORMAL,
-                dominant_share=1.0,
-                aging_factor=0.0,
-                final_priority=0.0,
-                resources={},
-                creation_time=time.time(),
-                waiting_time=0.0,
-                priority_class_name="wdrf-normal",
-                is_gang_scheduling=False,
-                pod_group_name="",
-                pod_group_total_count=0,
-                pod_group_current_count=0,
-            )
+        return inputs
 
     def _get_creation_time(self, workload: Dict[str, Any]) -> float:
         """Workload의 생성 시간을 추출합니다."""
         try:
             # creationTimestamp가 있으면 사용
             if "creationTimestamp" in workload["metadata"]:
-                import datetime
-
-                creation_str = workload["metadata"]["creationTimestamp"]
-                creation_dt = datetime.datetime.fromisoformat(
-                    creation_str.replace("Z", "+00:00")
-                )
-                return creation_dt.timestamp()
+                return _parse_k8s_timestamp(workload["metadata"]["creationTimestamp"])
 
             # 없으면 현재 시간 사용
             return time.time()
@@ -139,83 +353,57 @@ class PriorityCalculator:
             logger.warning(f"Failed to parse creation time: {e}")
             return time.time()
 
-    def _extract_workload_resources(self, workload: Dict[str, Any]) -> Dict[str, float]:
+    def _extract_workload_resources(
+        self, workload: Dict[str, Any], cfg: Optional[ConfigSnapshot] = None
+    ) -> Dict[str, float]:
         """Workload의 리소스 요구사항을 추출합니다."""
-        resources = {}
+        resource_names = (cfg or self._get_config()).resource_names
+        parse = parse_quantity
+        resources: Dict[str, float] = {}
 
         try:
-            # PodSets에서 리소스 추출
+            # PodSets에서 리소스 추출 (스케줄링 기준인 requests만 합산)
             pod_sets = workload.get("spec", {}).get("podSets", [])
 
             for pod_set in pod_sets:
                 template = pod_set.get("template", {})
                 containers = template.get("spec", {}).get("containers", [])
 
+                # Pod 하나의 요청량을 podSet별로 따로 모은 뒤 Pod 개수만큼 곱해 합산
+                pod_resources: Dict[str, float] = {}
                 for container in containers:
-                    container_resources = container.get("resources", {})
-
-                    # Requests 처리
-                    requests = container_resources.get("requests", {})
+                    requests = container.get("resources", {}).get("requests", {})
                     for resource_name, quantity in requests.items():
-                        if resource_name in Config.RESOURCE_WEIGHTS:
-                            if resource_name not in resources:
-                                resources[resource_name] = 0.0
-                            resources[resource_name] += self._parse_quantity(quantity)
-
-                    # Limits 처리
-                    limits = container_resources.get("limits", {})
-                    for resource_name, quantity in limits.items():
-                        if resource_name in Config.RESOURCE_WEIGHTS:
-                            if resource_name not in resources:
-                                resources[resource_name] = 0.0
-                            resources[resource_name] += self._parse_quantity(quantity)
-
-                # Pod 개수만큼 리소스 곱하기
+                        if resource_name in resource_names:
+                            pod_resources[resource_name] = pod_resources.get(
+                                resource_name, 0.0
+                            ) + parse(quantity)
+
                 count = pod_set.get("count", 1)
-                for resource_name in resources:
-                    resources[resource_name] *= count
+                for resource_name, amount in pod_resources.items():
+                    resources[resource_name] = (
+                        resources.get(resource_name, 0.0) + amount * count
+                    )
 
-            logger.debug(f"Extracted resources for workload: {resources}")
             return resources
 
         except Exception as e:
             logger.error(f"Failed to extract workload resources: {e}")
             return {}
 
-    def _parse_quantity(self, quantity) -> float:
-        """Kubernetes Quantity를 float로 변환합니다."""
-        if quantity is None:
-            return 0.0
-
-        quantity_str = str(quantity)
-
-        if quantity_str.endswith("m"):  # millicores
-            return float(quantity_str[:-1]) / 1000
-        elif quantity_str.endswith("Ki"):
-            return float(quantity_str[:-2]) * 1024
-        elif quantity_str.endswith("Mi"):
-            return float(quantity_str[:-2]) * 1024 * 1024
-        elif quantity_str.endswith("Gi"):
-            return float(quantity_str[:-2]) * 1024 * 1024 * 1024
-        elif quantity_str.endswith("Ti"):
-            return float(quantity_str[:-2]) * 1024 * 1024 * 1024 * 1024
-        else:
-            try:
-                return float(quantity_str)
-            except ValueError:
-                return 0.0
-
     def _determine_priority_tier(self, workload: Dict[str, Any]) -> PriorityTier:
         """Workload의 우선순위 계층을 결정합니다 (2개 Tier)."""
-        annotations = workload.get("metadata", {}).get("annotations", {})
+        # 어노테이션이 없는 일반적인 경우 빈 dict를 만들지 않고 바로 NORMAL
+        try:
+            annotations = workload["metadata"]["annotations"]
+        except (KeyError, TypeError):
+            return PriorityTier.NORMAL
 
-        # 높은 우선순위 조건들
-        if (
-            annotations.get("wdrf.x-k8s.io/urgent", "false").lower() == "true"
-            or annotations.get("wdrf.x-k8s.io/approved", "false").lower() == "true"
-            or annotations.get("wdrf.x-k8s.io/high-priority", "false").lower() == "true"
-        ):
-            return PriorityTier.HIGH
+        # 높은 우선순위 조건들 (하나라도 "true"이면 HIGH)
+        if annotations:
+            for key in _HIGH_PRIORITY_ANNOTATIONS:
+                if _annotation_is_true(annotations, key):
+                    return PriorityTier.HIGH
 
         # 기본값
         return PriorityTier.NORMAL
@@ -246,33 +434,33 @@ class PriorityCalculator:
 
                 if pod_group_name and pod_group_total_count:
                     gang_info["is_gang_scheduling"] = True
-                    gang_info["pod_group_name"] = pod_group_name
+                    # 같은 Pod Group의 Workload들이 이름 문자열을 공유하도록 intern
+                    gang_info["pod_group_name"] = sys.intern(pod_group_name)
                     gang_info["pod_group_total_count"] = int(pod_group_total_count)
                     gang_info["pod_group_current_count"] = pod_set.get("count", 0)
                     break
 
-            logger.debug(f"Gang scheduling info: {gang_info}")
             return gang_info
 
         except Exception as e:
             logger.error(f"Failed to extract gang scheduling info: {e}")
             return gang_info
 
-    def _calculate_aging_factor(self, waiting_time: float) -> float:
+    def _calculate_aging_factor(
+        self, waiting_time: float, cfg: Optional[ConfigSnapshot] = None
+    ) -> float:
         """Aging Factor를 계산합니다."""
-        if not Config.SCHEDULING_POLICIES["enable_aging"]:
+        if cfg is None:
+            cfg = self._get_config()
+
+        if not cfg.enable_aging:
             return 0.0
 
         # 대기 시간이 최대 aging 시간을 초과하지 않도록 제한
-        capped_waiting_time = min(waiting_time, Config.MAX_AGING_TIME)
+        capped_waiting_time = min(waiting_time, cfg.max_aging_time)
 
         # Aging 계수를 적용하여 factor 계산
-        aging_factor = capped_waiting_time * Config.AGING_COEFFICIENT
-
-        logger.debug(
-            f"Aging factor calculated: {aging_factor} (waiting time: {waiting_time}s)"
-        )
-        return aging_factor
+        return capped_waiting_time * cfg.aging_coefficient
 
     def _calculate_final_priority(
         self, priority_tier: PriorityTier, dominant_share: float, aging_factor: float
@@ -281,17 +469,64 @@ class PriorityCalculator:
         # 동일 Tier 내에서는 dominant_share - aging_factor가 작을수록 우선
         return dominant_share - aging_factor
 
-    def sort_workloads_by_priority(
-        self, workloads: List[Dict[str, Any]]
+    def calculate_priorities_batch(
+        self,
+        workloads: Sequence[Dict[str, Any]],
+        cluster: Optional[ClusterSnapshot] = None,
     ) -> List[WorkloadPriority]:
+        """여러 Workload의 우선순위를 입력 순서대로 계산합니다 (정렬하지 않음).
+
+        배치 전체에서 하나의 설정 스냅샷과 기준 시각을 사용하며,
+        필수 메타데이터가 없는 Workload는 결과에서 제외합니다.
+        """
+        cfg = self._get_config()
+        now = time.time()
+        calculate = self._calculate_priority
+        validate = self._validate_workload
         workload_priorities = []
         for workload in workloads:
-            priority = self.calculate_workload_priority(workload)
-            workload_priorities.append(priority)
+            identity = validate(workload)
+            if identity is None:
+                # 이름/네임스페이스가 없는 Workload는 우선순위를 적용할 수 없으므로 제외
+                logger.warning(
+                    "Skipping invalid workload: %s", self._describe_workload(workload)
+                )
+                continue
+            workload_priorities.append(calculate(workload, identity, cfg, now, cluster))
+
+        return workload_priorities
+
+    def sort_workloads_by_priority(
+        self,
+        workloads: Sequence[Dict[str, Any]],
+        cluster: Optional[ClusterSnapshot] = None,
+    ) -> List[WorkloadPriority]:
+        workload_priorities = self.calculate_priorities_batch(workloads, cluster)
+
         # 중요도(Tier) 우선, 동일 Tier 내에서는 dominant_share - aging_factor 오름차순
-        workload_priorities.sort(
-            key=lambda x: (x.priority_tier.value, x.final_priority)
-        )
+        # (Tier별로 나눈 뒤 각 Tier 안에서만 정렬하여 튜플 키를 만들지 않음)
+        buckets: Dict[PriorityTier, List[WorkloadPriority]] = {
+            tier: [] for tier in _TIERS_IN_SORT_ORDER
+        }
+        for workload_priority in workload_priorities:
+            buckets[workload_priority.priority_tier].append(workload_priority)
+
+        workload_priorities = []
+        for tier in _TIERS_IN_SORT_ORDER:
+            bucket = buckets[tier]
+            bucket.sort(key=_FINAL_PRIORITY_KEY)
+            workload_priorities.extend(bucket)
+
+        # Workload별 디버그 로그 대신 배치당 한 줄로 요약
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Priority sort done: total=%d high=%d normal=%d skipped=%d",
+                len(workload_priorities),
+                len(buckets[PriorityTier.HIGH]),
+                len(buckets[PriorityTier.NORMAL]),
+                len(workloads) - len(workload_priorities),
+            )
+
         logger.info(f"Sorted {len(workload_priorities)} workloads by priority")
         return workload_priorities
 
@@ -308,43 +543,43 @@ class PriorityCalculator:
                 "gang_scheduling_count": 0,
             }
 
-        # 우선순위 계층별 분포
-        tier_distribution = {}
-        for tier in PriorityTier:
-            tier_distribution[tier.value] = len(
-                [wp for wp in workload_priorities if wp.priority_tier == tier]
-            )
-
-        # 평균 대기 시간
-        total_waiting_time = sum(wp.waiting_time for wp in workload_priorities)
-        average_waiting_time = total_waiting_time / len(workload_priorities)
-
-        # 평균 Dominant Share
-        total_dominant_share = sum(wp.dominant_share for wp in workload_priorities)
-        average_dominant_share = total_dominant_share / len(workload_priorities)
-
-        # Gang Scheduling 개수
-        gang_scheduling_count = len(
-            [wp for wp in workload_priorities if wp.is_gang_scheduling]
-        )
-
+        # 분포/평균/최댓값/최솟값/Gang 개수를 한 번의 순회로 집계
+        tier_counts = [0] * len(PriorityTier)
+        total_waiting_time = 0.0
+        total_dominant_share = 0.0
+        highest_priority = float("-inf")
+        lowest_priority = float("inf")
+        gang_scheduling_count = 0
+
+        for wp in workload_priorities:
+            tier_counts[wp.priority_tier] += 1
+            total_waiting_time += wp.waiting_time
+            total_dominant_share += wp.dominant_share
+            final_priority = wp.final_priority
+            if final_priority > highest_priority:
+                highest_priority = final_priority
+            if final_priority < lowest_priority:
+                lowest_priority = final_priority
+            if wp.is_gang_scheduling:
+                gang_scheduling_count += 1
+
+        total_workloads = len(workload_priorities)
         return {
-            "total_workloads": len(workload_priorities),
-            "priority_distribution": tier_distribution,
-            "average_waiting_time": average_waiting_time,
-            "average_dominant_share": average_dominant_share,
-            "highest_priority": max(wp.final_priority for wp in workload_priorities),
-            "lowest_priority": min(wp.final_priority for wp in workload_priorities),
+            "total_workloads": total_workloads,
+            "priority_distribution": {
+                tier.label: tier_counts[tier] for tier in PriorityTier
+            },
+            "average_waiting_time": total_waiting_time / total_workloads,
+            "average_dominant_share": total_dominant_share / total_workloads,
+            "highest_priority": highest_priority,
+            "lowest_priority": lowest_priority,
             "gang_scheduling_count": gang_scheduling_count,
         }
 
     def should_override_priority(self, workload: Dict[str, Any]) -> bool:
         """우선순위 오버라이드가 필요한지 확인합니다."""
-        annotations = workload.get("metadata", {}).get("annotations", {})
-        override_value = annotations.get(
-            "wdrf.x-k8s.io/priority-override", "false"
-        ).lower()
-        return override_value == "true"
+        annotations = workload.get("metadata", {}).get("annotations") or {}
+        return _annotation_is_true(annotations, "wdrf.x-k8s.io/priority-override")
 
     def get_manual_priority(self, workload: Dict[str, Any]) -> int:
         """수동으로 설정된 우선순위를 가져옵니다."""
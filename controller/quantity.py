@@ -0,0 +1,65 @@
+"""
+Kubernetes Quantity 파싱 유틸리티
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+# 접미사 → 배수 (2글자 이진 접미사를 먼저 확인)
+_BINARY_SUFFIXES = {
+    "Ki": 1024.0,
+    "Mi": 1024.0**2,
+    "Gi": 1024.0**3,
+    "Ti": 1024.0**4,
+    "Pi": 1024.0**5,
+    "Ei": 1024.0**6,
+}
+# 1보다 작은 접미사는 부정확한 1e-3 등을 곱하지 않고 정확한 10의 거듭제곱으로 나눔
+_FRACTIONAL_SUFFIXES = {
+    "n": 1e9,
+    "u": 1e6,
+    "m": 1e3,
+}
+_DECIMAL_SUFFIXES = {
+    "k": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+    "T": 1e12,
+    "P": 1e15,
+    "E": 1e18,
+}
+
+
+def parse_quantity(quantity: Any) -> float:
+    """Kubernetes Quantity를 float로 변환합니다. 해석할 수 없으면 0.0을 반환합니다."""
+    # YAML의 따옴표 없는 숫자처럼 이미 숫자인 값은 문자열로 바꾸지 않고 바로 변환
+    if isinstance(quantity, (int, float, Decimal)) and not isinstance(quantity, bool):
+        return float(quantity)
+
+    if quantity is None:
+        return 0.0
+
+    return _parse_quantity_str(quantity if isinstance(quantity, str) else str(quantity))
+
+
+@lru_cache(maxsize=4096)
+def _parse_quantity_str(quantity_str: str) -> float:
+    """문자열 Quantity를 접미사 배수를 적용해 변환합니다 (같은 문자열은 캐시)."""
+    try:
+        multiplier = _BINARY_SUFFIXES.get(quantity_str[-2:])
+        if multiplier is not None:
+            return float(quantity_str[:-2]) * multiplier
+
+        suffix = quantity_str[-1:]
+        divisor = _FRACTIONAL_SUFFIXES.get(suffix)
+        if divisor is not None:
+            return float(quantity_str[:-1]) / divisor
+
+        multiplier = _DECIMAL_SUFFIXES.get(suffix)
+        if multiplier is not None:
+            return float(quantity_str[:-1]) * multiplier
+
+        return float(quantity_str)
+    except ValueError:
+        return 0.0
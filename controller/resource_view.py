@@ -4,110 +4,174 @@ Resource View for WDRF Controller
 """
 
 import logging
-from collections import defaultdict
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from .config import Config
+from .config import Config, ConfigSnapshot
+from .k8s_client import NodeInfo, PodInfo
+from .quantity import parse_quantity
 
 logger = logging.getLogger(__name__)
 
+# 사용량을 집계할 주요 네임스페이스 (Pod는 전체 네임스페이스에서 한 번에 조회한 뒤 걸러냄)
+USAGE_NAMESPACES = ("kueue-system", "default", "team-mlops")
+
+
+@dataclass(frozen=True)
+class ClusterSnapshot:
+    """한 사이클 동안 공유하는 클러스터 리소스 상태의 불변 스냅샷"""
+
+    __slots__ = (
+        "capacity",
+        "positive_capacity",
+        "usage",
+        "utilization",
+        "available",
+        "scarcity_order",
+        "gpu_nodes",
+        "total_nodes",
+    )
+
+    capacity: Mapping[str, float]
+    # Dominant Share 계산용: 용량이 0보다 큰 리소스만 포함
+    positive_capacity: Mapping[str, float]
+    usage: Mapping[str, float]
+    utilization: Mapping[str, float]
+    available: Mapping[str, float]
+    # 남은 비율(가용량/용량)이 낮은 리소스부터 정렬한 리소스 이름 (스케줄 가능 여부 검사 순서)
+    scarcity_order: Tuple[str, ...]
+    gpu_nodes: Tuple[str, ...]
+    total_nodes: int
+
+    def get_workload_dominant_share(
+        self, workload_resources: Mapping[str, float]
+    ) -> float:
+        """Workload의 Dominant Share를 계산합니다."""
+        positive_capacity = self.positive_capacity
+        dominant_share = 0.0
+
+        for resource_name, amount in workload_resources.items():
+            resource_capacity = positive_capacity.get(resource_name)
+            if resource_capacity is not None:
+                share = amount / resource_capacity
+                if share > dominant_share:
+                    dominant_share = share
+
+        return dominant_share
+
 
 class ResourceView:
     """클러스터 리소스 상태를 관리하는 클래스"""
 
-    def __init__(self, k8s_client):
+    def __init__(self, k8s_client, config: Optional[ConfigSnapshot] = None):
         """ResourceView를 초기화합니다."""
         self.k8s_client = k8s_client
-        self._cluster_capacity = {}
-        self._cluster_usage = {}
-        self._node_info = {}
+        self.config = config
+        self._cluster_capacity: Dict[str, float] = {}
+        self._cluster_usage: Dict[str, float] = {}
+        self._node_info: Dict[str, NodeInfo] = {}
+        # GPU 노드별 용량 (노드 목록이 갱신될 때 한 번 계산)
+        self._gpu_capacity: Dict[str, Dict[str, float]] = {}
+        # 마지막 새로고침 이후 계산한 클러스터 요약 (새로고침 시 무효화)
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._snapshot_cache: Optional[ClusterSnapshot] = None
+
+    def _get_config(self) -> ConfigSnapshot:
+        """고정된 설정 스냅샷을 반환합니다. 없으면 현재 Config로 생성합니다."""
+        return self.config if self.config is not None else Config.snapshot()
 
     def refresh_cluster_state(self):
         """클러스터 상태를 새로고침합니다."""
         try:
-            nodes = self.k8s_client.get_nodes()
-            self._update_cluster_capacity(nodes)
-            self._update_cluster_usage()
+            cfg = self._get_config()
+            # 노드 목록과 전체 네임스페이스의 Pod 목록을 병렬로 조회
+            fetched = self.k8s_client.fetch_snapshot()
+            self._update_cluster_capacity(fetched["nodes"], cfg)
+            self._update_cluster_usage(fetched["pods"], cfg)
             logger.info("Cluster state refreshed successfully")
         except Exception as e:
             logger.error(f"Failed to refresh cluster state: {e}")
+        finally:
+            self._invalidate_derived()
+
+    def _invalidate_derived(self) -> None:
+        """용량/사용량에서 파생된 스냅샷과 요약 캐시를 비웁니다."""
+        self._summary_cache = None
+        self._snapshot_cache = None
 
-    def _update_cluster_capacity(self, nodes: List[Dict[str, Any]]):
+    def _update_cluster_capacity(
+        self, nodes: List[NodeInfo], cfg: Optional[ConfigSnapshot] = None
+    ):
         """클러스터 전체 용량을 업데이트합니다."""
-        self._cluster_capacity = defaultdict(float)
+        resource_names = (cfg or self._get_config()).resource_names
+        parse = parse_quantity
+        self._invalidate_derived()
+        # defaultdict의 __missing__ 호출 없이 dict.get으로 누적
+        capacity: Dict[str, float] = {}
+        self._cluster_capacity = capacity
         self._node_info = {}
+        self._gpu_capacity = {}
 
         for node in nodes:
-            node_name = node["name"]
-            allocatable = node["allocatable"]
+            node_name = node.name
+            allocatable = node.allocatable
 
             # 노드 정보 저장
-            self._node_info[node_name] = {
-                "capacity": node["capacity"],
-                "allocatable": allocatable,
-                "labels": node["labels"],
-                "conditions": node["conditions"],
-            }
+            self._node_info[node_name] = node
 
             # 클러스터 전체 용량 계산
             for resource_name, quantity in allocatable.items():
-                if resource_name in Config.RESOURCE_WEIGHTS:
+                if resource_name in resource_names:
                     try:
-                        value = self._parse_quantity(quantity)
-                        self._cluster_capacity[resource_name] += value
+                        value = parse(quantity)
+                        capacity[resource_name] = (
+                            capacity.get(resource_name, 0.0) + value
+                        )
                     except (ValueError, TypeError):
                         logger.warning(
                             f"Failed to parse quantity for {resource_name}: {quantity}"
                         )
 
+            # GPU 노드 용량 계산 (조회 시마다 다시 파싱하지 않도록 여기서 한 번만)
+            if "nvidia.com/gpu" in allocatable:
+                gpu_count = parse_quantity(allocatable["nvidia.com/gpu"])
+                if gpu_count > 0:
+                    self._gpu_capacity[node_name] = {
+                        "gpu_count": gpu_count,
+                        "cpu": parse_quantity(allocatable.get("cpu", 0)),
+                        "memory": parse_quantity(allocatable.get("memory", 0)),
+                    }
+
         logger.info(f"Cluster capacity updated: {dict(self._cluster_capacity)}")
 
-    def _update_cluster_usage(self):
-        """클러스터 사용량을 업데이트합니다."""
-        self._cluster_usage = defaultdict(float)
+    def _update_cluster_usage(
+        self, pods: List[PodInfo], cfg: Optional[ConfigSnapshot] = None
+    ):
+        """Pod 목록으로 클러스터 사용량을 업데이트합니다 (USAGE_NAMESPACES만 집계)."""
+        resource_names = (cfg or self._get_config()).resource_names
+        self._invalidate_derived()
+        usage: Dict[str, float] = {}
+        self._cluster_usage = usage
 
-        # 모든 네임스페이스의 Pod들을 조회하여 사용량 계산
-        # 실제 구현에서는 더 효율적인 방법을 사용할 수 있습니다
         try:
-            # 주요 네임스페이스들만 조회 (성능 최적화)
-            target_namespaces = ["kueue-system", "default", "team-mlops"]
-
-            for namespace in target_namespaces:
-                pods = self.k8s_client.get_pods_in_namespace(namespace)
-                for pod in pods:
-                    if pod["status"] in ["Running", "Pending"]:
-                        for resource_name, amount in pod["resources"].items():
-                            if resource_name in Config.RESOURCE_WEIGHTS:
-                                self._cluster_usage[resource_name] += amount
+            for pod in pods:
+                if pod.namespace not in USAGE_NAMESPACES:
+                    continue
+                if pod.status in ["Running", "Pending"]:
+                    # 스케줄러와 동일하게 requests 기준으로 사용량 집계
+                    requests = pod.resources.get("requests", {})
+                    for resource_name, amount in requests.items():
+                        if resource_name in resource_names:
+                            usage[resource_name] = (
+                                usage.get(resource_name, 0.0) + amount
+                            )
 
             logger.info(f"Cluster usage updated: {dict(self._cluster_usage)}")
 
         except Exception as e:
             logger.error(f"Failed to update cluster usage: {e}")
 
-    def _parse_quantity(self, quantity) -> float:
-        """Kubernetes Quantity를 float로 변환합니다."""
-        if quantity is None:
-            return 0.0
-
-        quantity_str = str(quantity)
-
-        if quantity_str.endswith("m"):  # millicores
-            return float(quantity_str[:-1]) / 1000
-        elif quantity_str.endswith("Ki"):
-            return float(quantity_str[:-2]) * 1024
-        elif quantity_str.endswith("Mi"):
-            return float(quantity_str[:-2]) * 1024 * 1024
-        elif quantity_str.endswith("Gi"):
-            return float(quantity_str[:-2]) * 1024 * 1024 * 1024
-        elif quantity_str.endswith("Ti"):
-            return float(quantity_str[:-2]) * 1024 * 1024 * 1024 * 1024
-        else:
-            try:
-                return float(quantity_str)
-            except ValueError:
-                return 0.0
-
     def get_cluster_capacity(self) -> Dict[str, float]:
         """클러스터 전체 용량을 반환합니다."""
         return dict(self._cluster_capacity)
@@ -144,70 +208,44 @@ class ResourceView:
 
     def can_schedule_workload(self, workload_resources: Dict[str, float]) -> bool:
         """Workload가 스케줄링 가능한지 확인합니다."""
-        available = self.get_available_resources()
+        # 새로고침마다 한 번 계산한 스냅샷의 가용량을 재사용
+        # 가장 부족한 리소스부터 확인하여 거절될 Workload를 빨리 걸러냄
+        cluster = self.snapshot()
+        available = cluster.available
 
-        for resource_name, required in workload_resources.items():
-            if resource_name in Config.RESOURCE_WEIGHTS:
-                if available.get(resource_name, 0.0) < required:
-                    logger.debug(
-                        f"Cannot schedule workload: insufficient {resource_name}"
-                    )
-                    return False
+        for resource_name in cluster.scarcity_order:
+            required = workload_resources.get(resource_name)
+            if required is not None and available.get(resource_name, 0.0) < required:
+                logger.debug("Cannot schedule workload: insufficient %s", resource_name)
+                return False
 
         return True
 
     def get_workload_dominant_share(
-        self, workload_resources: Dict[str, float]
+        self, workload_resources: Mapping[str, float]
     ) -> float:
         """Workload의 Dominant Share를 계산합니다."""
         if not workload_resources:
             return 0.0
 
-        dominant_share = 0.0
-
-        for resource_name, amount in workload_resources.items():
-            if resource_name in self._cluster_capacity:
-                capacity = self._cluster_capacity[resource_name]
-                if capacity > 0:
-                    share = amount / capacity
-                    dominant_share = max(dominant_share, share)
-
-        return dominant_share
+        # 용량이 0보다 큰 리소스만 담긴 스냅샷 맵으로 계산
+        return self.snapshot().get_workload_dominant_share(workload_resources)
 
     def get_node_info(self, node_name: str) -> Dict[str, Any]:
         """특정 노드의 정보를 반환합니다."""
-        return self._node_info.get(node_name, {})
+        node = self._node_info.get(node_name)
+        return node.to_dict() if node is not None else {}
 
     def get_gpu_nodes(self) -> List[str]:
         """GPU가 있는 노드 목록을 반환합니다."""
-        gpu_nodes = []
-
-        for node_name, node_info in self._node_info.items():
-            allocatable = node_info.get("allocatable", {})
-            if "nvidia.com/gpu" in allocatable:
-                gpu_count = self._parse_quantity(allocatable["nvidia.com/gpu"])
-                if gpu_count > 0:
-                    gpu_nodes.append(node_name)
-
-        return gpu_nodes
+        return list(self._gpu_capacity)
 
     def get_gpu_capacity(self) -> Dict[str, Dict[str, float]]:
         """GPU 노드별 용량 정보를 반환합니다."""
-        gpu_capacity = {}
-
-        for node_name, node_info in self._node_info.items():
-            allocatable = node_info.get("allocatable", {})
-
-            if "nvidia.com/gpu" in allocatable:
-                gpu_count = self._parse_quantity(allocatable["nvidia.com/gpu"])
-                if gpu_count > 0:
-                    gpu_capacity[node_name] = {
-                        "gpu_count": gpu_count,
-                        "cpu": self._parse_quantity(allocatable.get("cpu", 0)),
-                        "memory": self._parse_quantity(allocatable.get("memory", 0)),
-                    }
-
-        return gpu_capacity
+        return {
+            node_name: dict(capacity)
+            for node_name, capacity in self._gpu_capacity.items()
+        }
 
     def calculate_resource_efficiency(
         self, workload_resources: Dict[str, float]
@@ -216,12 +254,13 @@ class ResourceView:
         if not workload_resources:
             return 0.0
 
+        resource_weights = self._get_config().resource_weights
         total_weighted_usage = 0.0
         total_weight = 0.0
 
         for resource_name, amount in workload_resources.items():
-            if resource_name in Config.RESOURCE_WEIGHTS:
-                weight = Config.get_resource_weight(resource_name)
+            if resource_name in resource_weights:
+                weight = resource_weights[resource_name]
                 total_weighted_usage += amount * weight
                 total_weight += weight
 
@@ -230,20 +269,51 @@ class ResourceView:
 
         return total_weighted_usage / total_weight
 
-    def get_cluster_summary(self) -> Dict[str, Any]:
-        """클러스터 상태 요약을 반환합니다."""
+    def snapshot(self) -> ClusterSnapshot:
+        """현재 클러스터 상태의 불변 스냅샷을 반환합니다. 다음 새로고침 전까지 재사용합니다."""
+        if self._snapshot_cache is not None:
+            return self._snapshot_cache
+
         capacity = self.get_cluster_capacity()
-        usage = self.get_cluster_usage()
-        utilization = self.get_cluster_utilization()
         available = self.get_available_resources()
 
+        def scarcity_key(resource_name: str) -> Tuple[float, str]:
+            # 남은 비율 오름차순 (용량이 없으면 0), 같으면 이름순
+            resource_capacity = capacity.get(resource_name, 0.0)
+            if resource_capacity <= 0:
+                return 0.0, resource_name
+            return available.get(resource_name, 0.0) / resource_capacity, resource_name
+
+        self._snapshot_cache = ClusterSnapshot(
+            capacity=MappingProxyType(capacity),
+            positive_capacity=MappingProxyType(
+                {name: value for name, value in capacity.items() if value > 0}
+            ),
+            usage=MappingProxyType(self.get_cluster_usage()),
+            utilization=MappingProxyType(self.get_cluster_utilization()),
+            available=MappingProxyType(available),
+            scarcity_order=tuple(
+                sorted(self._get_config().resource_names, key=scarcity_key)
+            ),
+            gpu_nodes=tuple(self._gpu_capacity),
+            total_nodes=len(self._node_info),
+        )
+        return self._snapshot_cache
+
+    def get_cluster_summary(self) -> Dict[str, Any]:
+        """클러스터 상태 요약을 반환합니다. 다음 새로고침 전까지 결과를 재사용합니다."""
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        cluster = self.snapshot()
         summary: Dict[str, Any] = {
-            "capacity": capacity,
-            "usage": usage,
-            "utilization": utilization,
-            "available": available,
-            "gpu_nodes": self.get_gpu_nodes(),
-            "total_nodes": len(self._node_info),
+            "capacity": dict(cluster.capacity),
+            "usage": dict(cluster.usage),
+            "utilization": dict(cluster.utilization),
+            "available": dict(cluster.available),
+            "gpu_nodes": list(cluster.gpu_nodes),
+            "total_nodes": cluster.total_nodes,
         }
 
+        self._summary_cache = summary
         return summary
@@ -5,6 +5,7 @@ Test Configuration and Fixtures
 
 import os
 import tempfile
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
@@ -17,8 +18,8 @@ from controller.resource_view import ResourceView
 
 @pytest.fixture(scope="session")
 def sample_workloads():
-    """테스트용 샘플 워크로드 데이터"""
-    return {
+    """테스트용 샘플 워크로드 데이터 (세션 공유이므로 최상위 매핑은 읽기 전용)"""
+    workloads = {
         "urgent_workload": {
             "metadata": {
                 "name": "urgent-job",
@@ -110,27 +111,81 @@ def sample_workloads():
             "status": {"conditions": [{"type": "Pending", "status": "True"}]},
         },
     }
+    return MappingProxyType(workloads)
 
 
 @pytest.fixture(scope="session")
 def sample_cluster_resources():
-    """테스트용 클러스터 리소스 데이터"""
+    """테스트용 클러스터 리소스 데이터 (세션 공유이므로 읽기 전용)"""
+    capacity = {"cpu": 100.0, "memory": 1000.0, "nvidia.com/gpu": 20.0}
+    usage = {"cpu": 30.0, "memory": 300.0, "nvidia.com/gpu": 8.0}
+    return MappingProxyType(
+        {
+            "capacity": MappingProxyType(capacity),
+            "usage": MappingProxyType(usage),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_k8s_client():
+    """세션 동안 한 번만 생성하는 Mock Kubernetes 클라이언트"""
+    with patch("controller.k8s_client.config"):
+        with patch("controller.k8s_client.client"):
+            client = KubernetesClient()
+    client.core_v1 = Mock()
+    client.custom_objects = Mock()
+    client.scheduling_v1 = Mock()
+    yield client
+    client.close()
+
+
+def _make_synthetic_workload(index):
+    """CPU 1개, GPU 1개를 요청하는 단일 Pod Workload를 생성합니다."""
     return {
-        "capacity": {"cpu": 100.0, "memory": 1000.0, "nvidia.com/gpu": 20.0},
-        "usage": {"cpu": 30.0, "memory": 300.0, "nvidia.com/gpu": 8.0},
+        "metadata": {
+            "name": f"workload-{index}",
+            "namespace": "default",
+            "annotations": {},
+        },
+        "spec": {
+            "podSets": [
+                {
+                    "count": 1,
+                    "template": {
+                        "spec": {
+                            "containers": [
+                                {
+                                    "resources": {
+                                        "requests": {
+                                            "cpu": "1",
+                                            "nvidia.com/gpu": "1",
+                                        }
+                                    }
+                                }
+                            ]
+                        }
+                    },
+                }
+            ]
+        },
     }
 
 
+@pytest.fixture(scope="session")
+def synthetic_workloads():
+    """성능 테스트용 Workload 100개 (세션 공유, 수정이 필요하면 deepcopy 후 사용)"""
+    return tuple(_make_synthetic_workload(i) for i in range(100))
+
+
 @pytest.fixture
-def mock_k8s_client():
-    """Mock Kubernetes 클라이언트"""
-    with patch("controller.k8s_client.config") as mock_config:
-        with patch("controller.k8s_client.client") as mock_client:
-            client = KubernetesClient()
-            client.core_v1 = Mock()
-            client.custom_objects = Mock()
-            client.scheduling_v1 = Mock()
-            yield client
+def mock_k8s_client(shared_k8s_client):
+    """Mock Kubernetes 클라이언트 (테스트마다 API Mock 설정과 모든 캐시 초기화)"""
+    client = shared_k8s_client
+    for api in (client.core_v1, client.custom_objects, client.scheduling_v1):
+        api.reset_mock(return_value=True, side_effect=True)
+    client._reset_caches()
+    return client
 
 
 @pytest.fixture
@@ -185,13 +240,18 @@ SCHEDULING_POLICIES:
 
 @pytest.fixture(autouse=True)
 def reset_config():
-    """각 테스트 후 설정 초기화"""
+    """각 테스트 전 Config 설정값을 저장하고 테스트 후 그대로 복원"""
+    saved = {
+        name: dict(value) if isinstance(value, dict) else value
+        for name, value in vars(Config).items()
+        if name.isupper()
+    }
     yield
-    # Config 클래스의 기본값으로 복원
-    Config.LOG_LEVEL = "INFO"
-    Config.LOOP_INTERVAL = 60
-    Config.AGING_COEFFICIENT = 0.05
-    Config.MAX_AGING_TIME = 1800
+    for name in [name for name in vars(Config) if name.isupper()]:
+        if name not in saved:
+            delattr(Config, name)
+    for name, value in saved.items():
+        setattr(Config, name, value)
 
 
 @pytest.fixture
@@ -3,16 +3,20 @@ Unit Tests for WDRF Controller
 WDRF Controller의 단위 테스트입니다.
 """
 
-import sys
+import tempfile
+import time
 import unittest
+from decimal import Decimal
+from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import Mock, patch
 
 import pytest
 
 from controller.config import Config
-from controller.k8s_client import KubernetesClient
+from controller.k8s_client import KubernetesClient, NodeInfo
 from controller.priority import PriorityCalculator, PriorityTier, WorkloadPriority
+from controller.quantity import parse_quantity
 from controller.resource_view import ResourceView
 
 
@@ -31,15 +35,44 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(Config.get_resource_weight("nvidia.com/gpu"), 10.0)
         self.assertEqual(Config.get_resource_weight("unknown"), 1.0)  # 기본값
 
+    def test_snapshot_resource_names(self):
+        """스냅샷의 리소스 이름 집합이 가중치 키와 일치하는지 테스트"""
+        cfg = Config.snapshot()
+        self.assertIsInstance(cfg.resource_names, frozenset)
+        self.assertEqual(cfg.resource_names, set(Config.RESOURCE_WEIGHTS))
+
+    def test_config_file_cache_ignores_unrelated_json(self):
+        """같은 디렉터리의 config.json을 읽거나 덮어쓰지 않고 내용이 바뀌면 다시 파싱하는지 테스트"""
+        from controller.__main__ import _read_config_data
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = Path(tmp_dir, "config.yaml")
+            unrelated = Path(tmp_dir, "config.json")
+            unrelated.write_text('{"LOG_LEVEL": "ERROR"}')
+
+            source.write_text("LOG_LEVEL: DEBUG\n")
+            self.assertEqual(_read_config_data(str(source)), {"LOG_LEVEL": "DEBUG"})
+            self.assertTrue(Path(tmp_dir, ".config.yaml-cache.json").exists())
+            self.assertEqual(unrelated.read_text(), '{"LOG_LEVEL": "ERROR"}')
+
+            # 캐시가 있어도 내용이 바뀌면 YAML을 다시 읽음
+            source.write_text("LOG_LEVEL: INFO\n")
+            self.assertEqual(_read_config_data(str(source)), {"LOG_LEVEL": "INFO"})
+
 
 class TestPriorityCalculator(unittest.TestCase):
     """우선순위 계산기 테스트"""
 
+    @classmethod
+    def setUpClass(cls):
+        """테스트 설정 (리소스 뷰와 계산기는 클래스 전체에서 공유)"""
+        cls.mock_resource_view = Mock()
+        cls.mock_resource_view.get_workload_dominant_share.return_value = 0.5
+        cls.calculator = PriorityCalculator(cls.mock_resource_view)
+
     def setUp(self):
-        """테스트 설정"""
-        self.mock_resource_view = Mock()
-        self.mock_resource_view.get_workload_dominant_share.return_value = 0.5
-        self.calculator = PriorityCalculator(self.mock_resource_view)
+        """이전 테스트의 입력 캐시가 남지 않도록 비움"""
+        self.calculator._input_cache.clear()
 
     def test_determine_priority_tier(self):
         """우선순위 계층 결정 테스트"""
@@ -55,6 +88,56 @@ class TestPriorityCalculator(unittest.TestCase):
         tier = self.calculator._determine_priority_tier(workload_normal)
         self.assertEqual(tier, PriorityTier.NORMAL)
 
+        # 메타데이터/어노테이션이 없으면 일반 우선순위
+        for workload in ({}, {"metadata": {}}, {"metadata": None}):
+            self.assertEqual(
+                self.calculator._determine_priority_tier(workload), PriorityTier.NORMAL
+            )
+
+        # 대소문자 무관, "true"가 아닌 값은 일반 우선순위
+        workload_upper: Dict[str, Any] = {
+            "metadata": {"annotations": {"wdrf.x-k8s.io/urgent": "TRUE"}}
+        }
+        self.assertEqual(
+            self.calculator._determine_priority_tier(workload_upper), PriorityTier.HIGH
+        )
+        workload_false: Dict[str, Any] = {
+            "metadata": {"annotations": {"wdrf.x-k8s.io/high-priority": "false"}}
+        }
+        self.assertEqual(
+            self.calculator._determine_priority_tier(workload_false),
+            PriorityTier.NORMAL,
+        )
+
+    def test_priority_tier_order_and_label(self):
+        """Tier가 정수로 정렬되고 설정 조회용 label을 제공하는지 테스트"""
+        self.assertLess(PriorityTier.HIGH, PriorityTier.NORMAL)
+        self.assertEqual(PriorityTier.HIGH.label, "high")
+        self.assertEqual(PriorityTier.NORMAL.label, "normal")
+
+        priority = self.calculator.calculate_workload_priority(
+            {"metadata": {"name": "job", "namespace": "default"}}
+        )
+        self.assertEqual(priority.priority_class_name, "wdrf-normal")
+        self.assertFalse(hasattr(priority, "__dict__"))
+
+    def test_get_creation_time(self):
+        """creationTimestamp 파싱 테스트 (기본 형식, 소수점 초, 시간대 오프셋)"""
+
+        def creation_time(timestamp):
+            return self.calculator._get_creation_time(
+                {"metadata": {"creationTimestamp": timestamp}}
+            )
+
+        self.assertEqual(creation_time("2024-01-02T03:04:05Z"), 1704164645.0)
+        self.assertEqual(creation_time("2024-01-02T03:04:05.5Z"), 1704164645.5)
+        self.assertEqual(creation_time("2024-01-02T12:04:05+09:00"), 1704164645.0)
+        # 6자리가 아닌 소수점 초와 오프셋의 조합 (Python 3.8~3.10 fromisoformat 미지원)
+        self.assertEqual(creation_time("2024-01-02T03:04:05.5+00:00"), 1704164645.5)
+        self.assertAlmostEqual(
+            creation_time("2024-01-01T21:34:05.123456789-05:30"), 1704164645.123456789
+        )
+
     def test_calculate_aging_factor(self):
         """Aging Factor 계산 테스트"""
         # Aging 비활성화
@@ -98,6 +181,123 @@ class TestPriorityCalculator(unittest.TestCase):
         )
         self.assertLess(priority_with_aging, priority_without_aging)
 
+    def test_priority_inputs_cached_by_resource_version(self):
+        """resourceVersion이 같으면 리소스를 다시 추출하지 않는지 테스트"""
+        workload = {
+            "metadata": {
+                "name": "job",
+                "namespace": "default",
+                "resourceVersion": "10",
+            },
+            "spec": {"podSets": []},
+        }
+
+        with patch.object(
+            self.calculator,
+            "_extract_workload_resources",
+            wraps=self.calculator._extract_workload_resources,
+        ) as extract:
+            first = self.calculator.calculate_workload_priority(workload)
+            second = self.calculator.calculate_workload_priority(workload)
+            self.assertEqual(extract.call_count, 1)
+            self.assertEqual(second.creation_time, first.creation_time)
+
+            workload["metadata"]["resourceVersion"] = "11"
+            self.calculator.calculate_workload_priority(workload)
+            self.assertEqual(extract.call_count, 2)
+
+    def test_cached_inputs_not_shared_with_results(self):
+        """결과의 resources를 수정해도 캐시된 입력값이 바뀌지 않는지 테스트"""
+        workload = {
+            "metadata": {
+                "name": "job",
+                "namespace": "default",
+                "resourceVersion": "10",
+            },
+            "spec": {
+                "podSets": [
+                    {
+                        "count": 1,
+                        "template": {
+                            "spec": {
+                                "containers": [
+                                    {"resources": {"requests": {"cpu": "2"}}}
+                                ]
+                            }
+                        },
+                    }
+                ]
+            },
+        }
+
+        first = self.calculator.calculate_workload_priority(workload)
+        first.resources["cpu"] = 100.0
+
+        second = self.calculator.calculate_workload_priority(workload)
+        self.assertEqual(second.resources, {"cpu": 2.0})
+        self.assertIsNot(second.resources, first.resources)
+
+    def test_sort_skips_invalid_workloads(self):
+        """메타데이터가 없는 Workload는 정렬 결과에서 제외되는지 테스트"""
+        valid = {
+            "metadata": {"name": "job", "namespace": "default"},
+            "spec": {"podSets": []},
+        }
+
+        invalid = {"metadata": {"name": "no-namespace"}, "spec": {"podSets": ["x"]}}
+
+        with self.assertLogs("controller.priority", level="WARNING") as logs:
+            sorted_priorities = self.calculator.sort_workloads_by_priority(
+                [valid, None, invalid]
+            )
+
+        self.assertEqual([p.workload_name for p in sorted_priorities], ["job"])
+        # 로그에는 Workload 전체가 아니라 식별자만 남김
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [
+                "Skipping invalid workload: NoneType",
+                "Skipping invalid workload: None/no-namespace",
+            ],
+        )
+
+    def test_get_priority_summary(self):
+        """우선순위 요약 집계 테스트"""
+
+        def make(tier, final_priority, waiting_time, gang):
+            return WorkloadPriority(
+                workload_name="job",
+                namespace="default",
+                priority_tier=tier,
+                dominant_share=0.5,
+                aging_factor=0.0,
+                final_priority=final_priority,
+                resources={},
+                creation_time=0.0,
+                waiting_time=waiting_time,
+                priority_class_name="wdrf-normal",
+                is_gang_scheduling=gang,
+                pod_group_name="",
+                pod_group_total_count=0,
+                pod_group_current_count=0,
+            )
+
+        summary = self.calculator.get_priority_summary(
+            [
+                make(PriorityTier.HIGH, 0.2, 10.0, True),
+                make(PriorityTier.NORMAL, -0.3, 20.0, False),
+                make(PriorityTier.NORMAL, 0.9, 30.0, False),
+            ]
+        )
+
+        self.assertEqual(summary["total_workloads"], 3)
+        self.assertEqual(summary["priority_distribution"], {"high": 1, "normal": 2})
+        self.assertEqual(summary["average_waiting_time"], 20.0)
+        self.assertEqual(summary["average_dominant_share"], 0.5)
+        self.assertEqual(summary["highest_priority"], 0.9)
+        self.assertEqual(summary["lowest_priority"], -0.3)
+        self.assertEqual(summary["gang_scheduling_count"], 1)
+
     def test_extract_workload_resources(self):
         """Workload 리소스 추출 테스트"""
         workload = {
@@ -128,37 +328,81 @@ class TestPriorityCalculator(unittest.TestCase):
 
         resources = self.calculator._extract_workload_resources(workload)
 
-        # Pod 개수만큼 곱해져야 함
-        # requests와 limits 모두에서 GPU를 계산하므로 1 + 1 = 2, 그 다음 2 * 2 = 4
+        # Pod 개수만큼 곱해져야 함 (limits는 스케줄링 기준이 아니므로 제외)
         self.assertEqual(resources["cpu"], 8.0)  # 4 * 2
         self.assertEqual(resources["memory"], 17179869184.0)  # 8Gi * 2 (정확한 값)
-        self.assertEqual(resources["nvidia.com/gpu"], 4.0)  # (1 + 1) * 2 = 4
+        self.assertEqual(resources["nvidia.com/gpu"], 2.0)  # 1 * 2
 
+    def test_extract_workload_resources_multiple_pod_sets(self):
+        """podSet마다 자기 Pod 개수만 곱해지는지 테스트"""
 
-class TestResourceView(unittest.TestCase):
-    """리소스 뷰 테스트"""
+        def pod_set(count, gpu):
+            return {
+                "count": count,
+                "template": {
+                    "spec": {
+                        "containers": [
+                            {"resources": {"requests": {"nvidia.com/gpu": gpu}}}
+                        ]
+                    }
+                },
+            }
 
-    def setUp(self):
-        """테스트 설정"""
-        self.mock_k8s_client = Mock()
-        self.resource_view = ResourceView(self.mock_k8s_client)
+        workload = {"spec": {"podSets": [pod_set(1, "2"), pod_set(3, "1")]}}
+
+        resources = self.calculator._extract_workload_resources(workload)
+
+        self.assertEqual(resources["nvidia.com/gpu"], 5.0)  # 2 * 1 + 1 * 3
+
+
+class TestParseQuantity(unittest.TestCase):
+    """Kubernetes Quantity 파싱 테스트"""
 
     def test_parse_quantity(self):
         """Quantity 파싱 테스트"""
         # CPU (millicores)
-        self.assertEqual(self.resource_view._parse_quantity("1000m"), 1.0)
-        self.assertEqual(self.resource_view._parse_quantity("500m"), 0.5)
+        self.assertEqual(parse_quantity("1000m"), 1.0)
+        self.assertEqual(parse_quantity("500m"), 0.5)
+        # 1e-3을 곱하면 0.009000000000000001이 되므로 1000으로 나눈 값과 같아야 함
+        for millicores in range(1, 1000):
+            self.assertEqual(parse_quantity(f"{millicores}m"), millicores / 1000)
 
         # 메모리
-        self.assertEqual(self.resource_view._parse_quantity("1Ki"), 1024.0)
-        self.assertEqual(self.resource_view._parse_quantity("1Mi"), 1048576.0)
-        self.assertEqual(self.resource_view._parse_quantity("1Gi"), 1073741824.0)
+        self.assertEqual(parse_quantity("1Ki"), 1024.0)
+        self.assertEqual(parse_quantity("1Mi"), 1048576.0)
+        self.assertEqual(parse_quantity("1Gi"), 1073741824.0)
 
         # GPU (정수)
-        self.assertEqual(self.resource_view._parse_quantity("4"), 4.0)
+        self.assertEqual(parse_quantity("4"), 4.0)
 
         # None 값
-        self.assertEqual(self.resource_view._parse_quantity(None), 0.0)
+        self.assertEqual(parse_quantity(None), 0.0)
+
+    def test_parse_quantity_decimal_suffixes(self):
+        """10진 접미사 및 해석 불가 값 파싱 테스트"""
+        self.assertEqual(parse_quantity("2k"), 2000.0)
+        self.assertEqual(parse_quantity("1G"), 1e9)
+        self.assertEqual(parse_quantity("1Ti"), 1024.0**4)
+        self.assertEqual(parse_quantity(8), 8.0)
+        self.assertEqual(parse_quantity("abc"), 0.0)
+        self.assertEqual(parse_quantity(""), 0.0)
+        self.assertEqual(parse_quantity("250u"), 0.00025)
+        self.assertAlmostEqual(parse_quantity("5n"), 5e-9)
+
+    def test_parse_quantity_numeric_values(self):
+        """이미 숫자인 값은 그대로 float로 변환되는지 테스트"""
+        self.assertEqual(parse_quantity(2.5), 2.5)
+        self.assertEqual(parse_quantity(Decimal("0.5")), 0.5)
+        self.assertEqual(parse_quantity(True), 0.0)
+
+
+class TestResourceView(unittest.TestCase):
+    """리소스 뷰 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.mock_k8s_client = Mock()
+        self.resource_view = ResourceView(self.mock_k8s_client)
 
     def test_get_workload_dominant_share(self):
         """Dominant Share 계산 테스트"""
@@ -197,6 +441,133 @@ class TestResourceView(unittest.TestCase):
             self.resource_view.can_schedule_workload(unschedulable_workload)
         )
 
+    def test_snapshot_dominant_share(self):
+        """클러스터 스냅샷의 Dominant Share가 ResourceView와 같은지 테스트"""
+        self.resource_view._cluster_capacity = {"cpu": 100.0, "nvidia.com/gpu": 10.0}
+        workload_resources = {"cpu": 50.0, "nvidia.com/gpu": 8.0, "unknown": 1.0}
+
+        cluster = self.resource_view.snapshot()
+
+        self.assertEqual(
+            cluster.get_workload_dominant_share(workload_resources),
+            self.resource_view.get_workload_dominant_share(workload_resources),
+        )
+        self.assertIs(self.resource_view.snapshot(), cluster)
+
+    def test_refresh_cluster_state_uses_parallel_fetch(self):
+        """노드/Pod 조회 결과로 용량과 사용량을 계산하는지 테스트"""
+        node = Mock(allocatable={"nvidia.com/gpu": "4", "cpu": "8"})
+        node.name = "gpu-node"
+        running = Mock(
+            status="Running", namespace="default", resources={"requests": {"cpu": 2.0}}
+        )
+        finished = Mock(
+            status="Succeeded",
+            namespace="default",
+            resources={"requests": {"cpu": 4.0}},
+        )
+        elsewhere = Mock(
+            status="Running", namespace="other", resources={"requests": {"cpu": 1.0}}
+        )
+        self.mock_k8s_client.fetch_snapshot.return_value = {
+            "nodes": [node],
+            "pods": [running, finished, elsewhere],
+        }
+
+        self.resource_view.refresh_cluster_state()
+
+        self.mock_k8s_client.fetch_snapshot.assert_called_once_with()
+        self.assertEqual(self.resource_view.get_cluster_capacity()["cpu"], 8.0)
+        self.assertEqual(self.resource_view.get_cluster_usage(), {"cpu": 2.0})
+
+    def test_get_node_info_converts_at_boundary(self):
+        """노드 정보가 조회 시점에만 dict로 변환되는지 테스트"""
+        condition = Mock(type="Ready", status="True")
+        node = NodeInfo(
+            name="gpu-node",
+            resource_version="7",
+            labels={},
+            capacity={"nvidia.com/gpu": "4"},
+            allocatable={"nvidia.com/gpu": "4"},
+            conditions=[condition],
+        )
+        self.resource_view._update_cluster_capacity([node])
+
+        info = self.resource_view.get_node_info("gpu-node")
+        self.assertEqual(info["conditions"], [{"type": "Ready", "status": "True"}])
+        self.assertEqual(self.resource_view.get_gpu_nodes(), ["gpu-node"])
+        self.assertEqual(self.resource_view.get_node_info("missing"), {})
+
+    def test_gpu_capacity_computed_once_per_node_update(self):
+        """GPU 노드 용량이 노드 갱신 시에만 계산되는지 테스트"""
+        gpu_node = Mock(allocatable={"nvidia.com/gpu": "2", "cpu": "8"})
+        gpu_node.name = "gpu-node"
+        cpu_node = Mock(allocatable={"cpu": "4"})
+        cpu_node.name = "cpu-node"
+        self.resource_view._update_cluster_capacity([gpu_node, cpu_node])
+
+        with patch("controller.resource_view.parse_quantity") as parse:
+            capacity = self.resource_view.get_gpu_capacity()
+            self.assertEqual(self.resource_view.get_gpu_nodes(), ["gpu-node"])
+            parse.assert_not_called()
+
+        self.assertEqual(capacity["gpu-node"]["gpu_count"], 2.0)
+        self.assertEqual(capacity["gpu-node"]["cpu"], 8.0)
+
+        # 반환값을 수정해도 내부 상태는 바뀌지 않음
+        capacity["gpu-node"]["gpu_count"] = 0
+        self.assertEqual(
+            self.resource_view.get_gpu_capacity()["gpu-node"]["gpu_count"], 2.0
+        )
+
+        self.resource_view._update_cluster_capacity([cpu_node])
+        self.assertEqual(self.resource_view.get_gpu_nodes(), [])
+
+    def test_schedulability_follows_usage_updates(self):
+        """사용량이 갱신되면 캐시된 스냅샷 대신 새 가용량으로 판단하는지 테스트"""
+        self.resource_view._cluster_capacity = {"nvidia.com/gpu": 4.0}
+        self.assertTrue(self.resource_view.can_schedule_workload({"nvidia.com/gpu": 2}))
+
+        busy_pod = Mock(
+            status="Running",
+            namespace="default",
+            resources={"requests": {"nvidia.com/gpu": 3}},
+        )
+        self.resource_view._update_cluster_usage([busy_pod])
+
+        self.assertFalse(
+            self.resource_view.can_schedule_workload({"nvidia.com/gpu": 2})
+        )
+
+    def test_scarcity_order_checks_scarcest_first(self):
+        """가장 부족한 리소스가 먼저 검사되는지 테스트"""
+        self.resource_view._cluster_capacity = {"cpu": 100.0, "nvidia.com/gpu": 4.0}
+        self.resource_view._cluster_usage = {"cpu": 10.0, "nvidia.com/gpu": 3.0}
+
+        order = self.resource_view.snapshot().scarcity_order
+        # 용량 정보가 없는 리소스(남은 비율 0) → GPU(25%) → CPU(90%)
+        self.assertLess(order.index("memory"), order.index("nvidia.com/gpu"))
+        self.assertLess(order.index("nvidia.com/gpu"), order.index("cpu"))
+        self.assertEqual(order[-1], "cpu")
+
+        self.assertFalse(
+            self.resource_view.can_schedule_workload({"cpu": 1, "nvidia.com/gpu": 2})
+        )
+        self.assertFalse(self.resource_view.can_schedule_workload({"memory": 1}))
+        self.assertTrue(
+            self.resource_view.can_schedule_workload({"cpu": 1, "nvidia.com/gpu": 1})
+        )
+
+    def test_cluster_summary_cached_until_refresh(self):
+        """클러스터 요약이 새로고침 전까지 재사용되는지 테스트"""
+        self.mock_k8s_client.fetch_snapshot.return_value = {"nodes": [], "pods": []}
+
+        summary = self.resource_view.get_cluster_summary()
+        self.assertIs(self.resource_view.get_cluster_summary(), summary)
+
+        self.resource_view.refresh_cluster_state()
+        self.assertIsNot(self.resource_view.get_cluster_summary(), summary)
+
 
 class TestKubernetesClient(unittest.TestCase):
     """Kubernetes 클라이언트 테스트"""
@@ -221,25 +592,530 @@ class TestKubernetesClient(unittest.TestCase):
         }
         self.assertFalse(self.client._is_workload_pending(non_pending_workload))
 
+        # status/conditions가 없거나 null이면 Pending 아님
+        self.assertFalse(self.client._is_workload_pending({}))
+        self.assertFalse(self.client._is_workload_pending({"status": None}))
+        self.assertFalse(
+            self.client._is_workload_pending({"status": {"conditions": None}})
+        )
+
+    def test_get_pending_workloads_paginates(self):
+        """Pending Workload 조회가 continue 토큰을 따라 모든 페이지를 읽는지 테스트"""
+        pending = {"status": {"conditions": [{"type": "Pending", "status": "True"}]}}
+        admitted = {"status": {"conditions": [{"type": "Admitted", "status": "True"}]}}
+        self.client.custom_objects = Mock()
+        self.client.custom_objects.list_cluster_custom_object.side_effect = [
+            {"items": [pending, admitted], "metadata": {"continue": "next"}},
+            {"items": [pending], "metadata": {}},
+        ]
+
+        workloads = self.client.get_pending_workloads()
+
+        self.assertEqual(len(workloads), 2)
+        calls = self.client.custom_objects.list_cluster_custom_object.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertNotIn("field_selector", calls[0][1])
+        self.assertEqual(calls[1][1]["_continue"], "next")
+
+    def test_get_local_queues_paginates(self):
+        """LocalQueue 조회가 limit/continue로 페이지 단위 조회하는지 테스트"""
+        self.client.custom_objects = Mock()
+        self.client.custom_objects.list_namespaced_custom_object.side_effect = [
+            {"items": [{"metadata": {"name": "lq-a"}}], "metadata": {"continue": "c"}},
+            {"items": [{"metadata": {"name": "lq-b"}}], "metadata": {}},
+        ]
+
+        queues = self.client.get_local_queues("default")
+
+        self.assertEqual([q["metadata"]["name"] for q in queues], ["lq-a", "lq-b"])
+        calls = self.client.custom_objects.list_namespaced_custom_object.call_args_list
+        self.assertEqual(calls[0][1]["limit"], Config.PAGE_SIZE)
+        self.assertEqual(calls[0][1]["plural"], "localqueues")
+        self.assertEqual(calls[1][1]["_continue"], "c")
+
+    def test_cluster_queues_micro_cached_until_write(self):
+        """ClusterQueue 조회가 TTL 동안 재사용되고 쓰기 요청 후 무효화되는지 테스트"""
+        self.client.custom_objects = Mock()
+        self.client.custom_objects.list_cluster_custom_object.return_value = {
+            "items": [{"metadata": {"name": "cq"}}],
+            "metadata": {},
+        }
+        list_calls = self.client.custom_objects.list_cluster_custom_object
+
+        self.client.get_cluster_queues()
+        self.client.get_cluster_queues()
+        self.assertEqual(list_calls.call_count, 1)
+
+        self.client.update_workload_priority_class("job", "default", "wdrf-high")
+        self.client.get_cluster_queues()
+        self.assertEqual(list_calls.call_count, 2)
+
+        with patch.object(Config, "READ_CACHE_TTL", 0):
+            self.client.get_cluster_queues()
+        self.assertEqual(list_calls.call_count, 3)
+
+    def test_priority_classes_ready_uses_informer_cache(self):
+        """Priority Class 존재 여부를 informer 캐시로 확인하는지 테스트"""
+        self.assertIsNone(self.client.priority_classes_ready())
+
+        self.client._priority_classes_synced = True
+        self.client.priority_classes_present = {"wdrf-high"}
+        self.assertFalse(self.client.priority_classes_ready())
+
+        self.client.priority_classes_present = {"wdrf-high", "wdrf-normal", "other"}
+        self.assertTrue(self.client.priority_classes_ready())
+
+    def test_reset_caches_clears_all_cached_state(self):
+        """_reset_caches가 조회/informer/watch 캐시를 모두 비우는지 테스트"""
+        self.client._priority_classes_verified_until = float("inf")
+        self.client._priority_classes_synced = True
+        self.client.priority_classes_present = {"wdrf-high"}
+        self.client._pod_resources_cache["uid"] = ("1", {})
+        self.client._workload_cache.replace([{"metadata": {"name": "job"}}])
+
+        self.client._reset_caches()
+
+        self.assertEqual(self.client._priority_classes_verified_until, 0.0)
+        self.assertIsNone(self.client.priority_classes_ready())
+        self.assertEqual(self.client.priority_classes_present, set())
+        self.assertEqual(len(self.client._pod_resources_cache), 0)
+        self.assertFalse(self.client._workload_cache.synced)
+        self.assertEqual(self.client._workload_cache.list(), [])
+
+    def test_check_priority_classes_is_read_only(self):
+        """Priority Class 확인이 목록 조회만 하고 생성하지 않는지 테스트"""
+
+        def priority_class(name):
+            item = Mock()
+            item.metadata.name = name
+            return item
+
+        self.client.scheduling_v1 = Mock()
+        list_classes = self.client.scheduling_v1.list_priority_class
+        list_classes.return_value.items = [priority_class("wdrf-high")]
+        self.assertFalse(self.client.check_priority_classes())
+
+        list_classes.return_value.items = [
+            priority_class("wdrf-high"),
+            priority_class("wdrf-normal"),
+        ]
+        self.assertTrue(self.client.check_priority_classes())
+        self.client.scheduling_v1.create_priority_class.assert_not_called()
+
+        # 확인에 성공하면 PRIORITY_CLASS_CHECK_TTL 동안 다시 조회하지 않음
+        self.assertTrue(self.client.check_priority_classes())
+        self.assertEqual(list_classes.call_count, 2)
+
+    def test_ensure_priority_classes_skips_known_classes(self):
+        """informer 캐시에 있는 Priority Class는 생성 요청을 보내지 않는지 테스트"""
+        class_names = list(Config.KUEUE_PRIORITY_CLASSES)
+        self.client.scheduling_v1 = Mock()
+        self.client._priority_classes_synced = True
+        self.client.priority_classes_present = set(class_names[1:])
+
+        self.assertTrue(self.client.ensure_priority_classes())
+
+        create = self.client.scheduling_v1.create_priority_class
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(create.call_args[0][0]["metadata"]["name"], class_names[0])
+
+    def test_find_priority_class_uses_indexes(self):
+        """이름/값/설명 조건으로 informer 캐시의 Priority Class를 찾는지 테스트"""
+
+        def priority_class(name, value, description):
+            item = Mock(value=value, description=description)
+            item.metadata.name = name
+            return item
+
+        self.client._replace_priority_classes(
+            [
+                priority_class("wdrf-high", 1000, "high"),
+                priority_class("wdrf-normal", 100, "normal"),
+                priority_class("other", 100, "other"),
+            ]
+        )
+
+        def names(found):
+            return [pc["name"] for pc in found]
+
+        self.assertEqual(
+            names(self.client.find_priority_class(value=100)),
+            ["other", "wdrf-normal"],
+        )
+        self.assertEqual(
+            names(self.client.find_priority_class(value=100, description="normal")),
+            ["wdrf-normal"],
+        )
+        self.assertEqual(
+            self.client.find_priority_class(name="wdrf-high", value=100), []
+        )
+
+        self.client._unindex_priority_class("other")
+        self.assertEqual(
+            names(self.client.find_priority_class(value=100)), ["wdrf-normal"]
+        )
+        self.assertNotIn("other", self.client.priority_classes_present)
+
+    def test_pending_workloads_served_from_watch_cache(self):
+        """캐시 동기화 후에는 LIST 없이 캐시에서 Pending Workload를 조회하는지 테스트"""
+        pending = {
+            "metadata": {"name": "a", "namespace": "default"},
+            "status": {"conditions": [{"type": "Pending", "status": "True"}]},
+        }
+        self.client.custom_objects = Mock()
+        self.client.custom_objects.list_cluster_custom_object.return_value = {
+            "items": [pending],
+            "metadata": {"resourceVersion": "100"},
+        }
+
+        self.assertEqual(self.client.sync_workload_cache(), "100")
+        list_calls = self.client.custom_objects.list_cluster_custom_object.call_count
+
+        self.assertEqual(self.client.get_pending_workloads(), [pending])
+        self.client._workload_cache.apply_event("DELETED", pending)
+        self.assertEqual(self.client.get_pending_workloads(), [])
+        self.assertEqual(
+            self.client.custom_objects.list_cluster_custom_object.call_count,
+            list_calls,
+        )
+
+    def test_workload_cache_indexes(self):
+        """Workload 캐시의 Pending / Pod Group 인덱스가 이벤트에 따라 갱신되는지 테스트"""
+        workload = {
+            "metadata": {"name": "a", "namespace": "default"},
+            "spec": {
+                "podSets": [
+                    {
+                        "template": {
+                            "metadata": {
+                                "labels": {"kueue.x-k8s.io/pod-group-name": "group-1"}
+                            }
+                        }
+                    }
+                ]
+            },
+            "status": {"conditions": [{"type": "Pending", "status": "True"}]},
+        }
+        cache = self.client._workload_cache
+        cache.replace([workload])
+        self.assertEqual(self.client.get_workloads_by_pod_group("group-1"), [workload])
+        self.assertEqual(self.client.get_pending_workloads(), [workload])
+
+        admitted = dict(workload, status={"conditions": []})
+        cache.apply_event("MODIFIED", admitted)
+        self.assertEqual(self.client.get_pending_workloads(), [])
+        self.assertEqual(self.client.get_workloads_by_pod_group("group-1"), [admitted])
+
+        cache.apply_event("DELETED", admitted)
+        self.assertEqual(self.client.get_workloads_by_pod_group("group-1"), [])
 
-def run_tests():
-    """테스트 실행"""
-    # 테스트 스위트 생성
-    test_suite = unittest.TestSuite()
+    def test_pod_group_predicates_tolerate_missing_fields(self):
+        """podSet 메타데이터가 비어 있거나 None이어도 False를 반환하는지 테스트"""
+        for workload in (
+            {},
+            {"spec": None},
+            {"spec": {"podSets": [{}]}},
+            {"spec": {"podSets": [{"template": {"metadata": {"labels": None}}}]}},
+        ):
+            self.assertFalse(self.client._is_gang_scheduling_workload(workload))
+            self.assertFalse(
+                self.client._workload_belongs_to_pod_group(workload, "group-a")
+            )
 
-    # 테스트 클래스들 추가
-    test_suite.addTest(unittest.makeSuite(TestConfig))
-    test_suite.addTest(unittest.makeSuite(TestPriorityCalculator))
-    test_suite.addTest(unittest.makeSuite(TestResourceView))
-    test_suite.addTest(unittest.makeSuite(TestKubernetesClient))
+    def test_gang_workloads_use_pod_group_index(self):
+        """캐시 동기화 후 Gang Workload 조회가 Pod Group 인덱스만 확인하는지 테스트"""
+
+        def workload(name, labels, annotations):
+            return {
+                "metadata": {"name": name, "namespace": "default"},
+                "spec": {
+                    "podSets": [
+                        {
+                            "template": {
+                                "metadata": {
+                                    "labels": labels,
+                                    "annotations": annotations,
+                                }
+                            }
+                        }
+                    ]
+                },
+            }
+
+        group_label = {"kueue.x-k8s.io/pod-group-name": "group-a"}
+        gang = workload(
+            "gang", group_label, {"kueue.x-k8s.io/pod-group-total-count": "2"}
+        )
+        grouped_only = workload("grouped", group_label, {})
+        plain = workload("plain", {}, {})
+        self.client._workload_cache.replace([gang, grouped_only, plain])
+
+        with patch.object(
+            self.client,
+            "_is_gang_scheduling_workload",
+            wraps=self.client._is_gang_scheduling_workload,
+        ) as is_gang:
+            result = self.client.get_gang_scheduling_workloads()
+
+        self.assertEqual(result, [gang])
+        self.assertEqual(is_gang.call_count, 2)
+
+    def test_get_nodes_uses_ttl_cache(self):
+        """노드 목록이 TTL 동안 캐시되는지 테스트"""
+        self.client.core_v1 = Mock()
+        self.client.core_v1.list_node.return_value.items = []
+
+        self.client.get_nodes()
+        self.client.get_nodes()
+        self.assertEqual(self.client.core_v1.list_node.call_count, 1)
+
+        # TTL이 0이면 매번 새로 조회
+        with patch.object(Config, "NODE_CACHE_TTL", 0):
+            self.client.get_nodes()
+        self.assertEqual(self.client.core_v1.list_node.call_count, 2)
+
+    def test_extract_pod_resources_splits_requests_and_limits(self):
+        """Pod 리소스를 requests/limits별로 합산하는지 테스트"""
+        container_a = Mock()
+        container_a.resources.requests = {"cpu": "500m", "nvidia.com/gpu": "1"}
+        container_a.resources.limits = {"cpu": "1"}
+        container_b = Mock()
+        container_b.resources.requests = {"cpu": "250m"}
+        container_b.resources.limits = None
+        pod = Mock()
+        pod.spec.containers = [container_a, container_b]
+
+        resources = self.client._extract_pod_resources(pod)
+
+        self.assertEqual(resources["requests"], {"cpu": 0.75, "nvidia.com/gpu": 1.0})
+        self.assertEqual(resources["limits"], {"cpu": 1.0})
+
+    def test_pod_resource_names_are_interned(self):
+        """Pod 리소스 이름이 설정의 리소스 이름과 같은 문자열 객체인지 테스트"""
+        container = Mock()
+        # API 응답처럼 런타임에 만들어진 (intern되지 않은) 문자열 키
+        container.resources.requests = {"".join(["nvidia.com/", "gpu"]): "1"}
+        container.resources.limits = None
+        pod = Mock()
+        pod.spec.containers = [container]
+
+        resources = self.client._compute_pod_resources(pod)
+
+        (resource_name,) = resources["requests"]
+        names = {name: name for name in Config.snapshot().resource_names}
+        self.assertIs(resource_name, names["nvidia.com/gpu"])
+
+    def test_pod_resources_cached_by_uid_and_resource_version(self):
+        """같은 UID/resourceVersion의 Pod는 리소스를 다시 계산하지 않는지 테스트"""
+        pod = Mock()
+        pod.metadata.uid = "uid-1"
+        pod.metadata.resource_version = "1"
+        container = Mock()
+        container.resources.requests = {"cpu": "1"}
+        container.resources.limits = None
+        pod.spec.containers = [container]
+
+        with patch.object(
+            self.client,
+            "_compute_pod_resources",
+            wraps=self.client._compute_pod_resources,
+        ) as compute:
+            first = self.client._extract_pod_resources(pod)
+            self.assertIs(self.client._extract_pod_resources(pod), first)
+            self.assertEqual(compute.call_count, 1)
+
+            pod.metadata.resource_version = "2"
+            self.client._extract_pod_resources(pod)
+            self.assertEqual(compute.call_count, 2)
+
+    def test_pod_resources_extracted_lazily(self):
+        """Pod 리소스는 resources에 처음 접근할 때만 계산되는지 테스트"""
+        pod = Mock()
+        pod.metadata.name = "pod-a"
+        pod.status.phase = "Succeeded"
+        pod.spec.containers = []
+        self.client.core_v1 = Mock()
+        self.client.core_v1.list_namespaced_pod.return_value.items = [pod]
+
+        with patch.object(
+            self.client,
+            "_extract_pod_resources",
+            return_value={"requests": {}, "limits": {}},
+        ) as extract:
+            pods = self.client.get_pods_in_namespace("default")
+            self.assertEqual(pods[0].name, "pod-a")
+            self.assertEqual(pods[0].status, "Succeeded")
+            extract.assert_not_called()
+
+            self.assertEqual(pods[0].resources["requests"], {})
+            pods[0].resources
+            extract.assert_called_once_with(pod)
+
+    def test_list_all_pods_single_paginated_call(self):
+        """전체 네임스페이스 Pod를 필드 셀렉터와 continue 토큰으로 조회하는지 테스트"""
+
+        def page(name, continue_token):
+            pod = Mock()
+            pod.metadata.name = name
+            result = Mock(items=[pod])
+            result.metadata._continue = continue_token
+            return result
+
+        self.client.core_v1 = Mock()
+        list_pods = self.client.core_v1.list_pod_for_all_namespaces
+        list_pods.side_effect = [page("pod-a", "next"), page("pod-b", None)]
+
+        pods = self.client.list_all_pods(field_selector="status.phase!=Failed")
+
+        self.assertEqual([pod.name for pod in pods], ["pod-a", "pod-b"])
+        first_call, second_call = list_pods.call_args_list
+        self.assertEqual(first_call[1]["field_selector"], "status.phase!=Failed")
+        self.assertEqual(first_call[1]["limit"], Config.PAGE_SIZE)
+        self.assertEqual(second_call[1]["_continue"], "next")
+        self.client.core_v1.list_namespaced_pod.assert_not_called()
+
+    def test_update_workload_priority_and_class(self):
+        """Priority Class와 우선순위를 단일 PATCH로 업데이트하는지 테스트"""
+        self.client.custom_objects = Mock()
+
+        result = self.client.update_workload_priority_and_class(
+            "test-job", "default", "wdrf-high", 500
+        )
+
+        self.assertTrue(result)
+        self.client.custom_objects.get_namespaced_custom_object.assert_not_called()
+        self.client.custom_objects.patch_namespaced_custom_object.assert_called_once()
+        kwargs = self.client.custom_objects.patch_namespaced_custom_object.call_args[1]
+        annotations = kwargs["body"]["metadata"]["annotations"]
+        self.assertEqual(annotations["wdrf.x-k8s.io/priority-class"], "wdrf-high")
+        self.assertEqual(annotations["wdrf.x-k8s.io/priority"], "500")
+        self.assertEqual(kwargs["_content_type"], "application/merge-patch+json")
+
+    def test_self_patch_event_does_not_wake_cycle(self):
+        """어노테이션만 바뀐 MODIFIED 이벤트는 사이클을 깨우지 않는지 테스트"""
+        from controller.controller import WDRFController
+
+        workload = {
+            "metadata": {"name": "job", "namespace": "default", "generation": 1},
+            "status": {"conditions": [{"type": "Pending", "status": "True"}]},
+        }
+        self.client.custom_objects = Mock()
+        self.client.custom_objects.list_cluster_custom_object.return_value = {
+            "items": [workload],
+            "metadata": {"resourceVersion": "1"},
+        }
+
+        controller = WDRFController()
+        controller.k8s_client = self.client
+        controller.running = True
+
+        def stream(events):
+            def _stream(*args, **kwargs):
+                yield from events
+                controller.running = False
+
+            return _stream
+
+        # 컨트롤러의 우선순위 PATCH로 어노테이션만 바뀐 이벤트
+        patched = {
+            "metadata": dict(
+                workload["metadata"],
+                resourceVersion="2",
+                annotations={"wdrf.x-k8s.io/priority": "500"},
+            ),
+            "status": workload["status"],
+        }
+        with patch("controller.k8s_client.watch.Watch") as mock_watch:
+            mock_watch.return_value.stream.side_effect = stream(
+                [{"type": "MODIFIED", "object": patched}]
+            )
+            controller._watch_workloads()
+        self.assertTrue(controller._workload_events.empty())
+
+        # 상태 조건이 바뀐 이벤트는 사이클을 깨움
+        admitted = dict(patched, status={"conditions": []})
+        controller.running = True
+        with patch("controller.k8s_client.watch.Watch") as mock_watch:
+            mock_watch.return_value.stream.side_effect = stream(
+                [{"type": "MODIFIED", "object": admitted}]
+            )
+            controller._watch_workloads()
+        self.assertEqual(controller._workload_events.get_nowait(), "MODIFIED")
+
+
+class TestWDRFController(unittest.TestCase):
+    """컨트롤러 단위 테스트 (Kubernetes 연결 없이 Mock 클라이언트 사용)"""
+
+    def setUp(self):
+        """테스트 설정"""
+        from controller.controller import WDRFController
+
+        self.controller = WDRFController()
+
+    def test_signal_wakes_cycle_wait(self):
+        """종료 시그널이 다음 사이클 대기를 즉시 깨우는지 테스트"""
+        self.controller.running = True
+        self.controller._signal_handler(15, None)
+
+        start = time.monotonic()
+        self.controller._wait_for_next_cycle()
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertFalse(self.controller.running)
+
+    def test_cycle_time_percentiles(self):
+        """최근 사이클 소요 시간의 p50/p99 계산 테스트"""
+        for cycle_time in range(1, 101):
+            self.controller._record_cycle_time(float(cycle_time))
+
+        stats = self.controller.get_controller_stats()
+        self.assertEqual(stats["p50_cycle_time"], 50.0)
+        self.assertEqual(stats["p99_cycle_time"], 99.0)
+
+    def test_unchanged_priority_skips_patch(self):
+        """적용한 우선순위가 바뀌지 않으면 PATCH를 생략하는지 테스트"""
+        self.controller.k8s_client = Mock()
+        self.controller.k8s_client.update_workload_priority_and_class.return_value = (
+            True
+        )
+        workload_priority = WorkloadPriority(
+            workload_name="test-workload",
+            namespace="default",
+            priority_tier=PriorityTier.NORMAL,
+            dominant_share=0.5,
+            aging_factor=0.0,
+            final_priority=0.5,
+            resources={"nvidia.com/gpu": 1.0},
+            creation_time=0.0,
+            waiting_time=0.0,
+            priority_class_name="wdrf-normal",
+            is_gang_scheduling=False,
+            pod_group_name="",
+            pod_group_total_count=0,
+            pod_group_current_count=0,
+        )
 
-    # 테스트 실행
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+        update = self.controller.k8s_client.update_workload_priority_and_class
+        with patch.object(Config, "WRITE_LEGACY_PRIORITY", True):
+            self.controller._update_workload_priorities([workload_priority])
+            self.controller._update_workload_priorities([workload_priority])
+            self.assertEqual(update.call_count, 1)
 
-    return result.wasSuccessful()
+            # 우선순위 값이 바뀌면 다시 PATCH
+            workload_priority.final_priority = 0.25
+            self.controller._update_workload_priorities([workload_priority])
+            self.assertEqual(update.call_count, 2)
 
+        # 레거시 우선순위를 기록하지 않으면 Priority Class 변경 시에만 PATCH
+        with patch.object(Config, "WRITE_LEGACY_PRIORITY", False):
+            self.controller._update_workload_priorities([workload_priority])
+            self.assertEqual(update.call_count, 3)
+            workload_priority.final_priority = 0.1
+            self.controller._update_workload_priorities([workload_priority])
+            self.assertEqual(update.call_count, 3)
+            workload_priority.priority_class_name = "wdrf-high"
+            self.controller._update_workload_priorities([workload_priority])
+            self.assertEqual(update.call_count, 4)
 
-if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+        # 레거시 우선순위는 실제로 기록한 PATCH(처음 2번)만 집계
+        self.assertEqual(self.controller.stats.total_priority_class_updates, 4)
+        self.assertEqual(self.controller.stats.total_priority_updates, 2)
@@ -3,8 +3,6 @@ WDRF Controller 통합 테스트
 실제 Kubernetes 환경과의 통합을 테스트합니다.
 """
 
-import subprocess
-import sys
 import time
 from typing import Any, Dict
 from unittest.mock import Mock, patch
@@ -129,15 +127,24 @@ class TestEndToEndWorkflow:
         # 리소스 추출 (PriorityCalculator에서)
         resources = priority_calculator._extract_workload_resources(workload)
         assert resources["cpu"] == 4.0  # 2 * 2 pods
-        assert resources["nvidia.com/gpu"] == 4.0  # (1 + 1) * 2 pods
+        assert resources["nvidia.com/gpu"] == 2.0  # 1 * 2 pods
 
         # 스케줄링 가능성 확인 (ResourceView에서)
         from controller.resource_view import ResourceView
 
         mock_k8s_client = Mock()
         resource_view = ResourceView(mock_k8s_client)
-        resource_view._cluster_capacity = {"cpu": 100.0, "nvidia.com/gpu": 10.0}
-        resource_view._cluster_usage = {"cpu": 50.0, "nvidia.com/gpu": 5.0}
+        # RESOURCE_WEIGHTS의 모든 주요 리소스(memory 포함)에 용량이 있어야 스케줄 가능
+        resource_view._cluster_capacity = {
+            "cpu": 100.0,
+            "memory": 1024.0**4,  # 1Ti
+            "nvidia.com/gpu": 10.0,
+        }
+        resource_view._cluster_usage = {
+            "cpu": 50.0,
+            "memory": 512 * 1024.0**3,  # 512Gi
+            "nvidia.com/gpu": 5.0,
+        }
 
         can_schedule = resource_view.can_schedule_workload(resources)
         assert can_schedule is True
@@ -153,48 +160,11 @@ class TestEndToEndWorkflow:
 class TestPerformanceIntegration:
     """성능 통합 테스트"""
 
-    def test_large_workload_processing(self, priority_calculator):
-        """대용량 워크로드 처리 성능 테스트"""
-        # 100개의 워크로드 생성
-        workloads = []
-        for i in range(100):
-            workload = {
-                "metadata": {
-                    "name": f"workload-{i}",
-                    "namespace": "default",
-                    "annotations": {},
-                },
-                "spec": {
-                    "podSets": [
-                        {
-                            "count": 1,
-                            "template": {
-                                "spec": {
-                                    "containers": [
-                                        {
-                                            "resources": {
-                                                "requests": {
-                                                    "cpu": "1",
-                                                    "nvidia.com/gpu": "1",
-                                                }
-                                            }
-                                        }
-                                    ]
-                                }
-                            },
-                        }
-                    ]
-                },
-            }
-            workloads.append(workload)
-
+    def test_large_workload_processing(self, priority_calculator, synthetic_workloads):
+        """대용량 워크로드 처리 성능 테스트 (100개 워크로드는 세션 fixture에서 한 번만 생성)"""
         # 성능 측정
         start_time = time.time()
-        priorities = []
-        for workload in workloads:
-            priority = priority_calculator.calculate_workload_priority(workload)
-            priorities.append(priority)
-
+        priorities = priority_calculator.calculate_priorities_batch(synthetic_workloads)
         end_time = time.time()
         processing_time = end_time - start_time
 
@@ -208,22 +178,26 @@ class TestPerformanceIntegration:
             assert priority.priority_tier in [PriorityTier.NORMAL, PriorityTier.HIGH]
 
     def test_memory_usage_under_load(self, mock_resource_view):
-        """부하 하에서의 메모리 사용량 테스트"""
+        """부하 하에서의 메모리 사용량 테스트
+
+        mock_resource_view는 실제 ResourceView이며 Dominant Share 계산은 Mock을
+        거치지 않습니다. Mock으로 바꾸면 호출 기록이 쌓여 Mock의 메모리를 측정하게 됩니다.
+        """
         import os
 
-        import psutil
+        psutil = pytest.importorskip("psutil")
 
         process = psutil.Process(os.getpid())
         initial_memory = process.memory_info().rss
 
-        # 대량의 리소스 계산 수행
+        # 대량의 리소스 계산 수행 (입력 dict는 재사용하여 계산 자체의 메모리만 측정)
+        get_dominant_share = mock_resource_view.get_workload_dominant_share
+        resources = {"cpu": 0.0, "memory": 0.0, "nvidia.com/gpu": 0.0}
         for i in range(1000):
-            resources = {
-                "cpu": float(i % 10),
-                "memory": float(i % 100),
-                "nvidia.com/gpu": float(i % 5),
-            }
-            mock_resource_view.get_workload_dominant_share(resources)
+            resources["cpu"] = float(i % 10)
+            resources["memory"] = float(i % 100)
+            resources["nvidia.com/gpu"] = float(i % 5)
+            get_dominant_share(resources)
 
         final_memory = process.memory_info().rss
         memory_increase = final_memory - initial_memory
@@ -241,23 +215,24 @@ class TestKubernetesIntegration:
         """Mock Kubernetes 환경 설정"""
         with patch("controller.k8s_client.config") as mock_config:
             with patch("controller.k8s_client.client") as mock_client:
-                # Mock API 응답 설정
-                mock_client.CoreV1Api.return_value.list_node.return_value.items = [
-                    Mock(
-                        spec=Mock(taints=[]),
-                        status=Mock(
-                            allocatable={
-                                "cpu": "100",
-                                "memory": "1000Gi",
-                                "nvidia.com/gpu": "10",
-                            }
-                        ),
-                    )
-                ]
+                # Mock API 응답 설정 (호출이 예외 없이 성공하도록 반환값을 명시)
+                node = Mock()
+                node.spec.taints = []
+                node.status.allocatable = {
+                    "cpu": "100",
+                    "memory": "1000Gi",
+                    "nvidia.com/gpu": "10",
+                }
+                mock_client.CoreV1Api.return_value.list_node.return_value.items = [node]
 
-                mock_client.CustomObjectsApi.return_value.list_namespaced_custom_object.return_value = {
+                custom_objects = mock_client.CustomObjectsApi.return_value
+                custom_objects.list_namespaced_custom_object.return_value = {
                     "items": []
                 }
+                custom_objects.list_cluster_custom_object.return_value = {"items": []}
+                mock_client.SchedulingV1Api.return_value.create_priority_class.return_value = {
+                    "status": "ok"
+                }
 
                 yield {"config": mock_config, "client": mock_client}
 
@@ -270,20 +245,11 @@ class TestKubernetesIntegration:
         assert client is not None
 
         # 노드 정보 조회 (Mock 환경에서)
-        try:
-            nodes = client.get_cluster_nodes()
-            assert isinstance(nodes, list)
-        except Exception:
-            # Mock 환경에서는 실패할 수 있음
-            pass
+        assert client.get_cluster_nodes() == []
+        assert len(client.get_nodes()) == 1
 
         # 워크로드 조회 (Mock 환경에서)
-        try:
-            workloads = client.get_pending_workloads()
-            assert isinstance(workloads, list)
-        except Exception:
-            # Mock 환경에서는 실패할 수 있음
-            pass
+        assert client.get_pending_workloads() == []
 
     def test_priority_class_management(self, mock_kubernetes_environment):
         """PriorityClass 관리 통합 테스트"""
@@ -292,20 +258,10 @@ class TestKubernetesIntegration:
         client = KubernetesClient()
 
         # PriorityClass 생성 (Mock 환경에서)
-        try:
-            result = client.ensure_priority_class("test-priority", 100)
-            assert result is True
-        except Exception:
-            # Mock 환경에서는 실패할 수 있음
-            pass
+        assert client.create_priority_class("test-priority", 100, "test") is True
 
-        # PriorityClass 업데이트 (Mock 환경에서)
-        try:
-            result = client.update_priority_class("test-priority", 200)
-            assert result is True
-        except Exception:
-            # Mock 환경에서는 실패할 수 있음
-            pass
+        # 설정된 PriorityClass 전체 확인 (Mock 환경에서)
+        assert client.ensure_priority_classes() is True
 
 
 @pytest.mark.integration
@@ -321,15 +277,10 @@ class TestErrorHandlingIntegration:
 
             from controller.k8s_client import KubernetesClient
 
-            client = KubernetesClient()
-
-            # 초기화 실패 처리
-            try:
-                result = client.initialize()
-                assert result is False
-            except Exception:
-                # 예외가 발생해도 적절히 처리되어야 함
-                pass
+            # 초기화 실패는 생성자에서 예외로 전달되어야 함
+            with patch.object(Config, "KUBECONFIG_PATH", ""):
+                with pytest.raises(Exception, match="Connection failed"):
+                    KubernetesClient()
 
     def test_invalid_workload_data(self, priority_calculator):
         """잘못된 워크로드 데이터 처리 테스트"""
@@ -361,53 +312,6 @@ class TestErrorHandlingIntegration:
             "nvidia.com/gpu": float("inf"),
         }
 
-        try:
-            dominant_share = mock_resource_view.get_workload_dominant_share(
-                large_resources
-            )
-            # 무한대 값이 적절히 처리되어야 함
-            assert dominant_share > 0
-        except Exception as e:
-            # 예외가 발생해도 적절히 처리되어야 함
-            assert isinstance(e, (ValueError, OverflowError))
-
-
-# 통합 테스트 실행을 위한 헬퍼 함수
-def run_integration_tests():
-    """통합 테스트 실행"""
-    import subprocess
-
-    try:
-        # pytest로 통합 테스트만 실행
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "pytest",
-                "tests/test_integration.py",
-                "-m",
-                "integration",
-                "-v",
-                "--tb=short",
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        print("Integration Test Results:")
-        print(result.stdout)
-
-        if result.stderr:
-            print("Errors:")
-            print(result.stderr)
-
-        return result.returncode == 0
-
-    except Exception as e:
-        print(f"Integration test execution failed: {e}")
-        return False
-
-
-if __name__ == "__main__":
-    success = run_integration_tests()
-    sys.exit(0 if success else 1)
+        dominant_share = mock_resource_view.get_workload_dominant_share(large_resources)
+        # 무한대 요청은 예외 없이 무한대 share로 계산되어야 함
+        assert dominant_share == float("inf")